@@ -0,0 +1,15 @@
+"""
+Compatibility helpers for older Python versions.
+
+The package still imports on Python 3.8+ for CLI fallback mode, while
+the Agent SDK path needs 3.10+.
+"""
+
+import sys
+from typing import Dict
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get
+# regular dict-backed instances.
+DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
@@ -20,6 +20,10 @@ from ..config.markdown import AgentDefinition, load_all_agents
 from ..permission import Permission, PermissionState
 
 
+# Leading @mention, e.g. "@simulink add a gain block"
+_MENTION_RE = re.compile(r'^@(\w+)\s*')
+
+
 @dataclass
 class RoutingResult:
     """Result of routing a message to an agent.
@@ -248,9 +252,14 @@ class _AgentRegistry:
         """
         message = message.strip()
 
+        # Commands only ever match at the start, so only lowercase a prefix
+        # long enough to compare against the longest command
+        prefix_len = max((len(c) for c in self._commands), default=0)
+        message_lower = message[:prefix_len].lower()
+
         # 1. Check for explicit command (/simulink, /git, etc.)
         for command, agent_name in self._commands.items():
-            if message.lower().startswith(command.lower()):
+            if message_lower.startswith(command.lower()):
                 agent = self._agents.get(agent_name)
                 if agent:
                     cleaned = message[len(command):].strip()
@@ -262,7 +271,7 @@ class _AgentRegistry:
                     )
 
         # 2. Check for @mention (@simulink, @architect, etc.)
-        mention_match = re.match(r'^@(\w+)\s*', message)
+        mention_match = _MENTION_RE.match(message)
         if mention_match:
             agent_name = mention_match.group(1)
             agent = self._agents.get(agent_name)
@@ -10,17 +10,146 @@ Restructured to use the new architecture:
 - Session processor for Claude SDK interaction
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from collections import deque
 from dataclasses import dataclass, field
 import threading
 import asyncio
 import atexit
+import concurrent.futures
+import io
+import re
+import secrets
+import shutil
+import subprocess
 import time
 import os
+import queue
+import warnings
+import weakref
 from pathlib import Path
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+# Bridges whose persistent loop still needs stopping at interpreter exit.
+# A single atexit hook walks this set instead of each bridge registering
+# (and unregistering) its own bound method.
+_live_bridges: "weakref.WeakSet[MatlabBridge]" = weakref.WeakSet()
+
+
+def _cleanup_live_bridges() -> None:
+    """atexit hook: stop the loops of bridges that were never shut down."""
+    for bridge in list(_live_bridges):
+        bridge._cleanup_loop()
+
+
+# Max streamed items buffered between polls; the oldest are dropped beyond
+# this (the final response still carries the full text)
+_ASYNC_BUFFER_MAXLEN = 4096
+
+
+def _to_str(value: Any) -> str:
+    """Coerce a MATLAB-supplied argument to str, passing str through as-is."""
+    if type(value) is str:
+        return value
+    return str(value) if value else ""
+
+
+def _drain_deque(buffer: Deque[Any]) -> List[Any]:
+    """Pop every item currently in buffer, oldest first.
+
+    deque.append/popleft are thread-safe, so this needs no lock even
+    while a producer keeps appending; items added during the drain are
+    left for the next call.
+    """
+    items = []
+    popleft = buffer.popleft
+    for _ in range(len(buffer)):
+        try:
+            items.append(popleft())
+        except IndexError:  # Cleared concurrently by start_async_message
+            break
+    return items
+
+
+def _run_background_jobs(jobs: "queue.SimpleQueue[Optional[Callable[[], None]]]") -> None:
+    """Run a bridge's fire-and-forget jobs in order until a None arrives.
+
+    Takes only the queue (not the bridge) so a parked worker never keeps
+    its bridge alive.
+    """
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        try:
+            job()
+        except Exception:
+            pass
+
+
+# Closed TabState objects kept for reuse by new tabs
+_TAB_STATE_POOL_MAX = 16
+
+# Tab statuses that must not be replaced by 'unread'
+_BUSY_STATUSES = frozenset({'working', 'attention'})
+
+# Valid values for TabState.status
+_VALID_STATUSES = frozenset({'ready', 'working', 'attention', 'unread'})
+
+# get_last_routing_info() result when nothing has been routed yet
+_EMPTY_ROUTING_INFO: Dict[str, Any] = {
+    'agent_name': '',
+    'command': '',
+    'is_explicit': False,
+    'confidence': 0.0,
+    'reason': '',
+}
+
+# Legacy execution mode -> (primary agent, auto_execute, bypass_mode)
+_EXEC_MODE_TABLE: Dict[str, Tuple[str, bool, bool]] = {
+    'plan': ('plan', False, False),
+    'prompt': ('build', False, False),
+    'auto': ('build', True, False),
+    'bypass': ('build', True, True),
+}
+
+# Well-formed Anthropic API key (fast path for validate_api_key)
+_API_KEY_RE = re.compile(r'sk-ant-[A-Za-z0-9_\-]{93,}')
+
+# Email address in `claude auth status` output
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Message:
+    """A single message in a tab's history.
+
+    Attributes:
+        role: Message author ('user', 'assistant', ...)
+        content: Message text
+        timestamp: Time the message was added
+        images: Optional image attachments
+    """
+    role: str
+    content: str
+    timestamp: float
+    images: Optional[List[Dict[str, Any]]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        result = {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.timestamp,
+        }
+        if self.images:
+            result["images"] = self.images
+        return result
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TabState:
     """Stores complete UI state for a single chat tab.
 
@@ -41,7 +170,7 @@ class TabState:
     """
     tab_id: str
     label: str = "Chat 1"
-    messages: List[Dict[str, Any]] = field(default_factory=list)
+    messages: List[Message] = field(default_factory=list)
     is_streaming: bool = False
     current_stream_message: str = ""
     status: str = "ready"
@@ -55,7 +184,7 @@ class TabState:
         return {
             "tabId": self.tab_id,
             "label": self.label,
-            "messages": self.messages,
+            "messages": [message.to_dict() for message in self.messages],
             "isStreaming": self.is_streaming,
             "currentStreamMessage": self.current_stream_message,
             "status": self.status,
@@ -65,6 +194,67 @@ class TabState:
             "lastActiveAt": self.last_active_at,
         }
 
+    def reset(self, tab_id: str, label: str) -> None:
+        """Reinitialize a recycled state as a brand-new tab."""
+        now = time.time()
+        self.tab_id = tab_id
+        self.label = label
+        self.messages.clear()
+        self.is_streaming = False
+        self.current_stream_message = ""
+        self.status = "ready"
+        self.unread_count = 0
+        self.scroll_position = 0
+        self.created_at = now
+        self.last_active_at = now
+
+
+@dataclass(**DATACLASS_SLOTS)
+class AsyncResponse:
+    """Final result of an async message.
+
+    Stored as a typed record when the request finishes; the dict that
+    MATLAB reads is only built (once) when get_async_response() asks.
+
+    Attributes:
+        text: Full response text
+        images: Image sources collected from the response
+        success: Whether the request completed normally
+        error: Error message if the request failed
+        session_id: SDK session ID
+        agent_name: Agent that handled the request
+        routing_reason: Why the agent was selected
+        interrupted: Whether the request was cancelled or interrupted
+    """
+    text: str = ''
+    images: List[Dict[str, Any]] = field(default_factory=list)
+    success: bool = False
+    error: str = ''
+    session_id: str = ''
+    agent_name: str = ''
+    routing_reason: str = ''
+    interrupted: bool = False
+    _dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for MATLAB (cached after first call)."""
+        if self._dict is None:
+            result = {
+                'text': self.text,
+                'images': self.images,
+                'success': self.success,
+                'error': self.error,
+                'session_id': self.session_id,
+                'agent_name': self.agent_name,
+                'routing_reason': self.routing_reason,
+            }
+            if self.interrupted:
+                result['interrupted'] = True
+            self._dict = result
+        return self._dict
+
 
 # Import new architecture components
 from .agent import Agent, RoutingResult, create_default_agents
@@ -76,7 +266,7 @@ from .tool.builtin import register_builtin_tools
 # Import existing utilities
 from .agent_manager import AgentManager
 from .image_queue import poll_images, clear_images
-from .logger import get_logger, configure_logger
+from .logger import LogLevel, get_logger, configure_logger
 from .matlab_tools import set_headless_mode as _set_headless_mode
 
 # Check SDK availability
@@ -107,6 +297,81 @@ class MatlabBridge:
         end
     """
 
+    __slots__ = (
+        "_logger",
+        "_log_info",
+        "_log_warn",
+        "_log_error",
+        "agent_manager",
+        "_use_sdk",
+        "_config",
+        "_current_model",
+        "_processor",
+        "_processor_running",
+        "_current_routing",
+        "_routing_info_cache",
+        "_process_manager",
+        "_async_response",
+        "_async_chunks",
+        "_async_content",
+        "_async_chunks_dropped",
+        "_async_content_dropped",
+        "_async_chunks_reported",
+        "_async_content_reported",
+        "_async_complete",
+        "_interrupt_requested",
+        "_current_task",
+        "_pending_stop",
+        "_state_lock",
+        "_loop",
+        "_loop_thread",
+        "_loop_ready",
+        "_runner",
+        "_runner_lock",
+        "_shutdown_requested",
+        "_tab_states",
+        "_tab_state_pool",
+        "_active_tab_id",
+        "_next_tab_number",
+        "_auth_method",
+        "_claude_cli_path_cache",
+        "_claude_cli_path_cached_at",
+        "_claude_native_path",
+        "_nvm_node_dir",
+        "_claude_common_paths",
+        "_auth_status_cache",
+        "_auth_status_cache_ts",
+        "_auth_refresh_pending",
+        "_worker_jobs",
+        "_worker_thread",
+        "_login_jobs",
+        "_login_thread",
+        "_login_in_progress",
+        "_api_key_mask_cache",
+        "__weakref__",
+    )
+
+    # How long a failed Claude CLI lookup is remembered (seconds)
+    _CLI_PATH_TTL_S = 60.0
+
+    # How long a `claude auth status` result stays valid (seconds)
+    _AUTH_STATUS_TTL_S = 5.0
+
+    # Skeleton for get_auth_info() results
+    _AUTH_INFO_TEMPLATE: Dict[str, Any] = {
+        'auth_method': '',
+        'cli_authenticated': False,
+        'cli_email': '',
+        'has_api_key': False,
+        'api_key_masked': '',
+    }
+
+    # set_execution_mode's DeprecationWarning is emitted once per process
+    _deprecation_warned: bool = False
+
+    # Whether the process-wide atexit loop cleanup hook is installed
+    _atexit_hooked: bool = False
+
     def __init__(self, use_agent_sdk: bool = True):
         """Initialize the bridge.
 
@@ -114,6 +379,10 @@ class MatlabBridge:
             use_agent_sdk: If True, use Claude Agent SDK (recommended).
         """
         self._logger = get_logger()
+        # Pre-bound logger methods for the hot paths
+        self._log_info = self._logger.info
+        self._log_warn = self._logger.warn
+        self._log_error = self._logger.error
         self.agent_manager = AgentManager()  # Local interceptor agents
         self._use_sdk = use_agent_sdk and AGENT_SDK_AVAILABLE
 
@@ -129,34 +398,85 @@ class MatlabBridge:
 
         # Current routing state
         self._current_routing: Optional[RoutingResult] = None
+        self._routing_info_cache: Optional[Dict[str, Any]] = None
 
         # CLI fallback mode
         self._process_manager: Optional[ClaudeProcessManager] = None
 
         # Async state
-        self._async_response: Optional[Dict[str, Any]] = None
-        self._async_chunks: List[str] = []
-        self._async_content: List[Dict[str, Any]] = []
+        self._async_response: Optional[Union[AsyncResponse, Dict[str, Any]]] = None
+        self._async_chunks: Deque[str] = deque(maxlen=_ASYNC_BUFFER_MAXLEN)
+        self._async_content: Deque[Dict[str, Any]] = deque(maxlen=_ASYNC_BUFFER_MAXLEN)
+        # Items the full buffers dropped (bumped by the producer) and how
+        # many of those the pollers have already logged
+        self._async_chunks_dropped: int = 0
+        self._async_content_dropped: int = 0
+        self._async_chunks_reported: int = 0
+        self._async_content_reported: int = 0
         self._async_complete: bool = False
-        self._async_lock = threading.Lock()
-        self._async_thread: Optional[threading.Thread] = None
         self._interrupt_requested: bool = False
         self._current_task: Optional[asyncio.Task] = None
+        # Processor stop scheduled by interrupt_process() and not yet awaited
+        self._pending_stop: Optional[concurrent.futures.Future] = None
 
         # Persistent event loop
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._loop_thread: Optional[threading.Thread] = None
+        self._loop_ready = threading.Event()
+
+        # Reused runner for when the persistent loop is not available
+        # (asyncio.Runner on 3.11+, a plain event loop before that)
+        self._runner: Optional[Any] = None
+        # A runner drives one coroutine at a time; serializes its callers
+        self._runner_lock = threading.Lock()
+
+        # Guards async and shutdown state (reentrant so shutdown checks
+        # can be combined with async-state updates in one critical section)
+        self._state_lock = threading.RLock()
 
         # Shutdown coordination
         self._shutdown_requested = False
-        self._shutdown_lock = threading.Lock()
-        self._atexit_registered = False
 
         # Tab state storage
         self._tab_states: Dict[str, TabState] = {}
+        self._tab_state_pool: List[TabState] = []
         self._active_tab_id: Optional[str] = None
         self._next_tab_number: int = 1
 
+        # 'subscription' (Claude CLI login) or 'api_key'
+        self._auth_method: str = 'subscription'
+
+        # Cached Claude CLI location (see _find_claude_cli)
+        self._claude_cli_path_cache: Optional[str] = None
+        self._claude_cli_path_cached_at: float = 0.0
+
+        # Claude CLI search locations, in lookup order after PATH
+        self._claude_native_path: str = os.path.expanduser('~/.claude/local/bin/claude')
+        self._nvm_node_dir: str = os.path.expanduser('~/.nvm/versions/node')
+        self._claude_common_paths: Tuple[str, ...] = (
+            '/usr/local/bin/claude',
+            '/opt/homebrew/bin/claude',
+            os.path.expanduser('~/.npm-global/bin/claude'),
+        )
+
+        # Cached check_cli_auth_status() result
+        self._auth_status_cache: Optional[Dict[str, Any]] = None
+        self._auth_status_cache_ts: float = 0.0
+        self._auth_refresh_pending: bool = False
+
+        # Background worker for auth status refreshes
+        self._worker_jobs: "queue.SimpleQueue[Optional[Callable[[], None]]]" = queue.SimpleQueue()
+        self._worker_thread: Optional[threading.Thread] = None
+
+        # Separate worker for CLI logins (up to 120 s each), so a login and
+        # a status refresh never wait behind each other
+        self._login_jobs: "queue.SimpleQueue[Optional[Callable[[], None]]]" = queue.SimpleQueue()
+        self._login_thread: Optional[threading.Thread] = None
+        self._login_in_progress: bool = False
+
+        # (api_key, masked) for the last key get_auth_info() displayed
+        self._api_key_mask_cache: Tuple[str, str] = ('', '')
+
         # Initialize based on mode
         if self._use_sdk:
             self._processor = SessionProcessor(model=self._current_model)
@@ -164,7 +484,7 @@ class MatlabBridge:
         else:
             self._process_manager = ClaudeProcessManager()
 
-        self._logger.info("MatlabBridge", "bridge_initialized", {
+        self._log_info("MatlabBridge", "bridge_initialized", {
             "sdk_mode": self._use_sdk,
             "sdk_available": AGENT_SDK_AVAILABLE,
             "model": self._current_model,
@@ -181,7 +501,7 @@ class MatlabBridge:
             config = load_config()
             self._config = config
         except Exception as e:
-            self._logger.warn("MatlabBridge", "config_load_failed", {
+            self._log_warn("MatlabBridge", "config_load_failed", {
                 "error": str(e)
             })
             self._config = None
@@ -192,14 +512,14 @@ class MatlabBridge:
 
         if agents_dir.exists():
             count = Agent.load(str(agents_dir))
-            self._logger.info("MatlabBridge", "agents_loaded_from_files", {
+            self._log_info("MatlabBridge", "agents_loaded_from_files", {
                 "count": count,
                 "path": str(agents_dir),
             })
         else:
             # Create default agents programmatically
             create_default_agents()
-            self._logger.info("MatlabBridge", "default_agents_created", {
+            self._log_info("MatlabBridge", "default_agents_created", {
                 "count": len(Agent.list()),
             })
 
@@ -208,36 +528,51 @@ class MatlabBridge:
         def run_loop():
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
+            # Signal once the loop is actually running
+            self._loop.call_soon(self._loop_ready.set)
             self._loop.run_forever()
 
         self._loop_thread = threading.Thread(target=run_loop, daemon=True)
         self._loop_thread.start()
 
-        time.sleep(0.1)  # Give loop time to start
+        self._loop_ready.wait(timeout=5.0)
 
-        atexit.register(self._cleanup_loop)
-        self._atexit_registered = True
+        _live_bridges.add(self)
+        if not MatlabBridge._atexit_hooked:
+            MatlabBridge._atexit_hooked = True
+            atexit.register(_cleanup_live_bridges)
 
     def _cleanup_loop(self) -> None:
-        """Clean up the persistent event loop."""
+        """Clean up the persistent event loop.
+
+        Runs at interpreter exit, so it only waits briefly for the
+        processor before stopping the loop.
+        """
+        if self._shutdown_requested:
+            # shutdown() already stopped the processor and the loop
+            return
+
         if self._loop and self._loop.is_running():
             if self._processor_running and self._processor:
+                self._processor.request_stop()
                 future = asyncio.run_coroutine_threadsafe(
                     self._processor.stop(), self._loop
                 )
                 try:
-                    future.result(timeout=5)
+                    future.result(timeout=0.5)
                 except Exception:
                     pass
             self._loop.call_soon_threadsafe(self._loop.stop)
 
     def _run_in_loop(self, coro, timeout: float = 30.0):
         """Run a coroutine in the persistent event loop."""
-        with self._shutdown_lock:
-            if self._shutdown_requested:
-                raise RuntimeError("Bridge is shutting down")
+        # Single bool read; the flag only ever goes from False to True
+        if self._shutdown_requested:
+            coro.close()
+            raise RuntimeError("Bridge is shutting down")
 
         if not self._loop or not self._loop.is_running():
+            coro.close()
             raise RuntimeError("Event loop not running")
 
         future = asyncio.run_coroutine_threadsafe(coro, self._loop)
@@ -247,6 +582,24 @@ class MatlabBridge:
             future.cancel()
             raise
 
+    def _run_without_loop(self, coro):
+        """Run a coroutine to completion when the persistent loop is down.
+
+        Reuses one runner across calls instead of creating and tearing
+        down a new event loop each time, as asyncio.run() would. Calls
+        from several threads (overlapping async messages) take turns.
+        """
+        with self._runner_lock:
+            if self._runner is None:
+                if hasattr(asyncio, "Runner"):
+                    self._runner = asyncio.Runner()
+                else:
+                    self._runner = asyncio.new_event_loop()
+
+            if isinstance(self._runner, asyncio.AbstractEventLoop):
+                return self._runner.run_until_complete(coro)
+            return self._runner.run(coro)
+
     def configure_logging(self, config: Dict[str, Any]) -> None:
         """Configure logging from MATLAB settings."""
         configure_logger(
@@ -281,7 +634,7 @@ class MatlabBridge:
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Try to dispatch message to a local interceptor agent."""
-        message = str(message) if message else ""
+        message = _to_str(message)
         handled, response, agent_name = self.agent_manager.dispatch(
             message, context or {}
         )
@@ -300,8 +653,8 @@ class MatlabBridge:
         resume_session: bool = True
     ) -> Dict[str, Any]:
         """Send a message to Claude (synchronous)."""
-        prompt = str(prompt) if prompt else ""
-        context = str(context) if context else ""
+        prompt = _to_str(prompt)
+        context = _to_str(context)
 
         if self._use_sdk:
             return self._send_message_sdk(prompt, context)
@@ -320,12 +673,14 @@ class MatlabBridge:
 
         try:
             response = self._run_in_loop(self._query_processor_async(full_prompt))
+            interrupted = response.get('interrupted', False)
             return {
                 'text': response.get('text', ''),
-                'success': True,
-                'error': '',
+                'success': not interrupted,
+                'error': 'Interrupted by user' if interrupted else '',
                 'session_id': response.get('session_id', ''),
-                'tool_uses': response.get('tool_uses', [])
+                'tool_uses': response.get('tool_uses', []),
+                'interrupted': interrupted
             }
         except Exception as e:
             return {
@@ -333,11 +688,21 @@ class MatlabBridge:
                 'success': False,
                 'error': str(e),
                 'session_id': '',
-                'tool_uses': []
+                'tool_uses': [],
+                'interrupted': False
             }
 
+    async def _await_pending_stop(self) -> None:
+        """Let an interrupt's processor stop finish before the processor is reused."""
+        pending_stop = self._pending_stop
+        if pending_stop is not None:
+            self._pending_stop = None
+            await asyncio.wrap_future(pending_stop)
+
     async def _query_processor_async(self, prompt: str) -> Dict[str, Any]:
         """Query processor asynchronously."""
+        await self._await_pending_stop()
+
         if not self._processor:
             raise RuntimeError("Processor not initialized")
 
@@ -358,35 +723,28 @@ class MatlabBridge:
         resume_session: bool = True
     ) -> None:
         """Start an async message to Claude."""
-        with self._shutdown_lock:
-            if self._shutdown_requested:
-                with self._async_lock:
-                    self._async_response = {
-                        'text': '',
-                        'images': [],
-                        'success': False,
-                        'error': 'Bridge is shutting down',
-                        'session_id': '',
-                        'agent_name': '',
-                        'routing_reason': ''
-                    }
-                    self._async_complete = True
-                return
+        if self._shutdown_requested:
+            self._finalize_async(error='Bridge is shutting down')
+            return
 
-        prompt = str(prompt) if prompt else ""
-        context = str(context) if context else ""
+        prompt = _to_str(prompt)
+        context = _to_str(context)
 
-        self._logger.info("MatlabBridge", "async_message_started", {
+        self._log_info("MatlabBridge", "async_message_started", {
             "prompt_length": len(prompt),
             "context_length": len(context),
             "sdk_mode": self._use_sdk
         })
 
-        with self._async_lock:
-            self._async_response = None
-            self._async_chunks = []
-            self._async_content = []
+        with self._state_lock:
+            # Clear the completion flag before the response so lock-free
+            # readers never see "complete" paired with a missing response
             self._async_complete = False
+            self._async_response = None
+            self._async_chunks.clear()
+            self._async_content.clear()
+            self._async_chunks_dropped = self._async_chunks_reported = 0
+            self._async_content_dropped = self._async_content_reported = 0
             self._interrupt_requested = False
 
         clear_images()
@@ -395,28 +753,33 @@ class MatlabBridge:
         routing = None
         if self._use_sdk:
             routing = Agent.route(prompt)
-            self._current_routing = routing
+            self._set_current_routing(routing)
 
-            self._logger.info("MatlabBridge", "agent_routing", {
+            self._log_info("MatlabBridge", "agent_routing", {
                 "agent_name": routing.agent.name,
                 "routing_type": routing.routing_type,
                 "reason": routing.reason
             })
 
         if self._use_sdk:
-            self._async_thread = threading.Thread(
-                target=self._run_sdk_async,
-                args=(prompt, context, routing),
-                daemon=True
-            )
-            self._async_thread.start()
+            coro = self._build_sdk_coro(prompt, context, routing)
+            if self._loop and self._loop.is_running():
+                # Scheduling onto the persistent loop is already non-blocking
+                asyncio.run_coroutine_threadsafe(coro, self._loop)
+            else:
+                threading.Thread(
+                    target=self._run_without_loop,
+                    args=(coro,),
+                    daemon=True
+                ).start()
         else:
             def on_chunk(chunk: str) -> None:
-                with self._async_lock:
-                    self._async_chunks.append(chunk)
+                if len(self._async_chunks) == _ASYNC_BUFFER_MAXLEN:
+                    self._async_chunks_dropped += 1
+                self._async_chunks.append(chunk)
 
             def on_complete(response: Dict[str, Any]) -> None:
-                with self._async_lock:
+                with self._state_lock:
                     self._async_response = response
                     self._async_complete = True
 
@@ -429,19 +792,22 @@ class MatlabBridge:
                 resume_session=resume_session
             )
 
-    def _run_sdk_async(
+    def _build_sdk_coro(
         self,
         prompt: str,
         context: str,
         routing: Optional[RoutingResult] = None
-    ) -> None:
-        """Run SDK query in background thread."""
+    ):
+        """Build the coroutine that runs an SDK query and publishes its result."""
         message = routing.cleaned_message if routing else prompt
         full_prompt = f"{context}\n\n{message}" if context else message
         agent_name = routing.agent.name if routing else "general"
+        routing_reason = routing.reason if routing else ''
 
         async def run():
             try:
+                await self._await_pending_stop()
+
                 # Ensure processor is started with correct agent
                 if routing and routing.agent:
                     # Use processor's actual state, not potentially-stale flag
@@ -468,99 +834,95 @@ class MatlabBridge:
                         await self._processor.start(agent)
                         self._processor_running = True
 
-                text_parts = []
+                text_buf = io.StringIO()
                 images = []
 
+                # Hoist per-item lookups out of the streaming loop (the
+                # buffers are only ever cleared, never replaced). The
+                # interrupt flag changes mid-stream, so it is re-read.
+                chunk_buf = self._async_chunks
+                content_buf = self._async_content
+                append_chunk = chunk_buf.append
+                append_content = content_buf.append
+                write_text = text_buf.write
+
                 async for content in self._processor.query(full_prompt):
                     if self._interrupt_requested:
-                        self._logger.info("MatlabBridge", "async_interrupted", {
+                        self._log_info("MatlabBridge", "async_interrupted", {
                             "agent_name": agent_name,
-                            "text_so_far": len(''.join(text_parts))
+                            "text_so_far": text_buf.tell()
                         })
                         break
 
-                    with self._async_lock:
-                        self._async_content.append(content)
-
-                        if content.get('type') == 'text':
-                            self._async_chunks.append(content.get('text', ''))
-                            text_parts.append(content.get('text', ''))
-                        elif content.get('type') == 'image':
+                    # Single producer; deque appends need no lock. A full
+                    # deque drops its oldest item on append, so count that
+                    if len(content_buf) == _ASYNC_BUFFER_MAXLEN:
+                        self._async_content_dropped += 1
+                    append_content(content)
+
+                    content_type = content.get('type')
+                    if content_type == 'text':
+                        chunk = content.get('text', '')
+                    elif content_type == 'tool_use':
+                        chunk = f"\n[Using tool: {content.get('name', 'unknown')}]\n"
+                    else:
+                        if content_type == 'image':
                             images.append(content.get('source', {}))
-                        elif content.get('type') == 'tool_use':
-                            tool_text = f"\n[Using tool: {content.get('name', 'unknown')}]\n"
-                            self._async_chunks.append(tool_text)
-                            text_parts.append(tool_text)
-
-                response_text = ''.join(text_parts)
-
-                with self._async_lock:
-                    self._async_response = {
-                        'text': response_text,
-                        'images': images,
-                        'success': True,
-                        'error': '',
-                        'session_id': self._processor.session_id or '',
-                        'agent_name': agent_name,
-                        'routing_reason': routing.reason if routing else ''
-                    }
-                    self._async_complete = True
+                        continue
+
+                    if len(chunk_buf) == _ASYNC_BUFFER_MAXLEN:
+                        self._async_chunks_dropped += 1
+                    append_chunk(chunk)
+                    write_text(chunk)
+
+                response_text = text_buf.getvalue()
+
+                self._finalize_async(
+                    success=True,
+                    text=response_text,
+                    images=images,
+                    session_id=self._processor.session_id or '',
+                    agent_name=agent_name,
+                    routing_reason=routing_reason,
+                )
 
-                self._logger.info("MatlabBridge", "async_complete", {
+                self._log_info("MatlabBridge", "async_complete", {
                     "agent_name": agent_name,
                     "response_length": len(response_text),
                     "image_count": len(images),
                 })
 
             except asyncio.CancelledError:
-                self._logger.info("MatlabBridge", "async_cancelled", {
+                self._log_info("MatlabBridge", "async_cancelled", {
                     "agent_name": agent_name
                 })
-                with self._async_lock:
-                    self._async_response = {
-                        'text': '',
-                        'images': [],
-                        'success': False,
-                        'error': 'Cancelled by user',
-                        'session_id': '',
-                        'agent_name': agent_name,
-                        'routing_reason': routing.reason if routing else '',
-                        'interrupted': True
-                    }
-                    self._async_complete = True
+                self._finalize_async(
+                    error='Cancelled by user',
+                    agent_name=agent_name,
+                    routing_reason=routing_reason,
+                    interrupted=True,
+                )
 
             except Exception as e:
-                self._logger.error("MatlabBridge", "async_error", {
+                self._log_error("MatlabBridge", "async_error", {
                     "agent_name": agent_name,
                     "error": str(e),
                     "error_type": type(e).__name__
                 })
 
-                with self._async_lock:
-                    self._async_response = {
-                        'text': '',
-                        'images': [],
-                        'success': False,
-                        'error': str(e),
-                        'session_id': '',
-                        'agent_name': agent_name,
-                        'routing_reason': routing.reason if routing else ''
-                    }
-                    self._async_complete = True
+                self._finalize_async(
+                    error=str(e),
+                    agent_name=agent_name,
+                    routing_reason=routing_reason,
+                )
 
             finally:
-                with self._async_lock:
-                    if not self._async_complete:
-                        self._async_response = {
-                            'text': '',
-                            'images': [],
-                            'success': False,
-                            'error': 'Unexpected error',
-                            'session_id': '',
-                            'agent_name': agent_name,
-                            'routing_reason': routing.reason if routing else ''
-                        }
-                        self._async_complete = True
+                self._finalize_async(
+                    error='Unexpected error',
+                    agent_name=agent_name,
+                    routing_reason=routing_reason,
+                    if_pending=True,
+                )
 
         async def run_with_cancel_support():
             self._current_task = asyncio.current_task()
@@ -569,39 +931,101 @@ class MatlabBridge:
             finally:
                 self._current_task = None
 
-        if self._loop and self._loop.is_running():
-            asyncio.run_coroutine_threadsafe(run_with_cancel_support(), self._loop)
-        else:
-            asyncio.run(run_with_cancel_support())
+        return run_with_cancel_support()
+
+    def _finalize_async(
+        self,
+        *,
+        success: bool = False,
+        text: str = '',
+        images: Optional[List[Dict[str, Any]]] = None,
+        error: str = '',
+        session_id: str = '',
+        agent_name: str = '',
+        routing_reason: str = '',
+        interrupted: bool = False,
+        if_pending: bool = False
+    ) -> bool:
+        """Publish the final async response and mark the request complete.
+
+        Args:
+            if_pending: Only publish if no response has been published yet.
+
+        Returns:
+            True if the response was published
+        """
+        # Lock-free early out for the common already-complete case; the
+        # check is repeated under the lock before publishing
+        if if_pending and self._async_complete:
+            return False
+
+        response = AsyncResponse(
+            text=text,
+            images=images if images is not None else [],
+            success=success,
+            error=error,
+            session_id=session_id,
+            agent_name=agent_name,
+            routing_reason=routing_reason,
+            interrupted=interrupted,
+        )
+
+        with self._state_lock:
+            if if_pending and self._async_complete:
+                return False
+            # Publish the response before the flag: is_async_complete() and
+            # get_async_response() read these without taking the lock
+            self._async_response = response
+            self._async_complete = True
+        return True
 
     def poll_async_chunks(self) -> List[str]:
         """Poll for new async text chunks."""
-        with self._async_lock:
-            chunks = self._async_chunks.copy()
-            self._async_chunks = []
-            return chunks
+        if not self._async_chunks:
+            return []
+        self._async_chunks_reported = self._log_stream_overflow(
+            "chunks", self._async_chunks_dropped, self._async_chunks_reported
+        )
+        return _drain_deque(self._async_chunks)
 
     def poll_async_content(self) -> List[Dict[str, Any]]:
         """Poll for new async content."""
-        with self._async_lock:
-            content = self._async_content.copy()
-            self._async_content = []
-
-        direct_images = poll_images()
-        for img in direct_images:
-            content.append(img)
+        if not self._async_content:
+            # Idle or image-only poll: nothing streamed to merge
+            return poll_images()
 
+        self._async_content_reported = self._log_stream_overflow(
+            "content", self._async_content_dropped, self._async_content_reported
+        )
+        content = _drain_deque(self._async_content)
+        content.extend(poll_images())
         return content
 
+    def _log_stream_overflow(self, buffer_name: str, dropped: int, reported: int) -> int:
+        """Log items a buffer dropped since the last poll, if any.
+
+        Returns:
+            The drop count now reported
+        """
+        if dropped != reported:
+            self._log_warn("MatlabBridge", "async_buffer_overflow", {
+                "buffer": buffer_name,
+                "dropped": dropped - reported,
+                "maxlen": _ASYNC_BUFFER_MAXLEN,
+            })
+        return dropped
+
     def is_async_complete(self) -> bool:
         """Check if async message is complete."""
-        with self._async_lock:
-            return self._async_complete
+        # Single attribute read; atomic under the GIL
+        return self._async_complete
 
     def get_async_response(self) -> Optional[Dict[str, Any]]:
         """Get the complete async response."""
-        with self._async_lock:
-            return self._async_response
+        response = self._async_response
+        if isinstance(response, AsyncResponse):
+            return response.to_dict()
+        return response
 
     def stop_process(self) -> None:
         """Stop any running process."""
@@ -610,32 +1034,35 @@ class MatlabBridge:
 
     def interrupt_process(self) -> bool:
         """Interrupt running async process."""
-        self._logger.info("MatlabBridge", "interrupt_requested", {
+        self._log_info("MatlabBridge", "interrupt_requested", {
             "sdk_mode": self._use_sdk,
             "async_complete": self._async_complete
         })
 
-        with self._async_lock:
+        # Nothing to interrupt; skip the lock on the idle path
+        if self._async_complete:
+            return False
+
+        with self._state_lock:
             if self._async_complete:
                 return False
 
             self._interrupt_requested = True
-            self._async_response = {
-                'text': '',
-                'images': [],
-                'success': False,
-                'error': 'Interrupted by user',
-                'session_id': '',
-                'agent_name': '',
-                'routing_reason': '',
-                'interrupted': True
-            }
-            self._async_complete = True
+            self._finalize_async(error='Interrupted by user', interrupted=True)
 
-        if self._current_task and not self._current_task.done():
+        task = self._current_task
+        if task and not task.done():
             if self._loop and self._loop.is_running():
-                self._loop.call_soon_threadsafe(self._current_task.cancel)
-                time.sleep(0.1)
+                async def cancel_task():
+                    task.cancel()
+                    await asyncio.wait((task,))
+
+                # Returns as soon as the task has processed the cancellation
+                future = asyncio.run_coroutine_threadsafe(cancel_task(), self._loop)
+                try:
+                    future.result(timeout=2.0)
+                except Exception:
+                    pass
 
         if self._use_sdk and self._processor_running and self._processor:
             try:
@@ -648,13 +1075,13 @@ class MatlabBridge:
                         finally:
                             self._processor_running = False
 
-                    future = asyncio.run_coroutine_threadsafe(stop_processor(), self._loop)
-                    try:
-                        future.result(timeout=2.0)
-                    except Exception:
-                        pass
+                    # Don't block the UI on SDK teardown; the next message
+                    # awaits this before touching the processor
+                    self._pending_stop = asyncio.run_coroutine_threadsafe(
+                        stop_processor(), self._loop
+                    )
             except Exception as e:
-                self._logger.warn("MatlabBridge", "interrupt_processor_error", {
+                self._log_warn("MatlabBridge", "interrupt_processor_error", {
                     "error": str(e)
                 })
 
@@ -666,26 +1093,15 @@ class MatlabBridge:
 
     def shutdown(self, timeout: float = 5.0) -> bool:
         """Gracefully shutdown the bridge."""
-        self._logger.info("MatlabBridge", "shutdown_started", {
+        self._log_info("MatlabBridge", "shutdown_started", {
             "timeout": timeout,
             "sdk_mode": self._use_sdk
         })
 
-        with self._shutdown_lock:
+        with self._state_lock:
             self._shutdown_requested = True
 
-        with self._async_lock:
-            if not self._async_complete:
-                self._async_response = {
-                    'text': '',
-                    'images': [],
-                    'success': False,
-                    'error': 'Shutdown requested',
-                    'session_id': '',
-                    'agent_name': '',
-                    'routing_reason': ''
-                }
-                self._async_complete = True
+            self._finalize_async(error='Shutdown requested', if_pending=True)
 
         clean_shutdown = True
 
@@ -695,14 +1111,23 @@ class MatlabBridge:
         if self._process_manager:
             self._process_manager.stop_process()
 
-        if self._atexit_registered:
+        # Leave a runner that is still busy to the thread driving it
+        if self._runner is not None and self._runner_lock.acquire(blocking=False):
             try:
-                atexit.unregister(self._cleanup_loop)
-                self._atexit_registered = False
+                self._runner.close()
             except Exception:
                 pass
+            finally:
+                self._runner = None
+                self._runner_lock.release()
+
+        # Let the workers exit once any queued job has finished
+        self._worker_jobs.put(None)
+        self._login_jobs.put(None)
+
+        _live_bridges.discard(self)
 
-        self._logger.info("MatlabBridge", "shutdown_complete", {
+        self._log_info("MatlabBridge", "shutdown_complete", {
             "clean": clean_shutdown
         })
 
@@ -713,27 +1138,33 @@ class MatlabBridge:
         if not self._loop or not self._loop.is_running():
             return True
 
-        try:
-            if self._processor_running and self._processor:
-                async def stop_with_timeout():
-                    try:
-                        await asyncio.wait_for(
-                            self._processor.stop(),
-                            timeout=timeout * 0.6
-                        )
-                    except asyncio.TimeoutError:
-                        pass
-                    except Exception:
-                        pass
+        if threading.current_thread() is self._loop_thread:
+            # Called from a callback on the loop itself: blocking on a
+            # scheduled coroutine or joining our own thread would stall it,
+            # so stop the processor in a task and stop the loop after it
+            loop = self._loop
+
+            def on_processor_stopped(task: asyncio.Task) -> None:
+                self._pending_stop = None
+                self._processor_running = False
+                loop.stop()
 
+            loop.create_task(
+                self._stop_processor_with_timeout(timeout * 0.6)
+            ).add_done_callback(on_processor_stopped)
+            return False
+
+        try:
+            if self._pending_stop is not None or (self._processor_running and self._processor):
                 future = asyncio.run_coroutine_threadsafe(
-                    stop_with_timeout(), self._loop
+                    self._stop_processor_with_timeout(timeout * 0.6), self._loop
                 )
                 try:
                     future.result(timeout=timeout * 0.7)
                 except Exception:
                     pass
                 finally:
+                    self._pending_stop = None
                     self._processor_running = False
 
             self._loop.call_soon_threadsafe(self._loop.stop)
@@ -746,11 +1177,27 @@ class MatlabBridge:
             return True
 
         except Exception as e:
-            self._logger.error("MatlabBridge", "shutdown_event_loop_error", {
+            self._log_error("MatlabBridge", "shutdown_event_loop_error", {
                 "error": str(e)
             })
             return False
 
+    async def _stop_processor_with_timeout(self, timeout: float) -> None:
+        """Stop the processor for shutdown, giving up after timeout seconds.
+
+        An interrupt's pending stop is finished instead of starting a
+        second one.
+        """
+        async def stop():
+            await self._await_pending_stop()
+            if self._processor_running and self._processor:
+                await self._processor.stop()
+
+        try:
+            await asyncio.wait_for(stop(), timeout=timeout)
+        except Exception:
+            pass
+
     def register_agent(self, agent: Any) -> None:
         """Register a local interceptor agent."""
         self.agent_manager.register_agent(agent)
@@ -773,22 +1220,33 @@ class MatlabBridge:
 
     def clear_conversation(self) -> None:
         """Clear conversation history and reset."""
-        self._current_routing = None
+        self._set_current_routing(None)
 
         if self._use_sdk and self._processor:
-            if self._loop and self._loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._reset_processor_async(), self._loop
-                )
-                try:
-                    future.result(timeout=10)
-                except Exception:
-                    pass
+            loop = self._loop
+            if loop and loop.is_running():
+                # Only completion matters here, so skip the concurrent
+                # Future that run_coroutine_threadsafe would build
+                done = threading.Event()
+
+                def on_reset_done(task: asyncio.Task) -> None:
+                    if not task.cancelled():
+                        task.exception()  # Retrieved so it isn't logged
+                    done.set()
+
+                def start_reset() -> None:
+                    task = loop.create_task(self._reset_processor_async())
+                    task.add_done_callback(on_reset_done)
+
+                loop.call_soon_threadsafe(start_reset)
+                done.wait(timeout=10)
             else:
-                asyncio.run(self._reset_processor_async())
+                self._run_without_loop(self._reset_processor_async())
 
     async def _reset_processor_async(self) -> None:
         """Reset the processor asynchronously."""
+        await self._await_pending_stop()
+
         if self._processor_running and self._processor:
             await self._processor.stop()
             self._processor_running = False
@@ -833,32 +1291,48 @@ class MatlabBridge:
             return self._processor.current_agent.name
         return ""
 
+    def _set_current_routing(self, routing: Optional[RoutingResult]) -> None:
+        """Record the latest routing decision and drop the cached info dict."""
+        self._current_routing = routing
+        self._routing_info_cache = None
+
     def get_last_routing_info(self) -> Dict[str, Any]:
         """Get information about the last routing decision."""
         if not self._current_routing:
-            return {
-                'agent_name': '',
-                'command': '',
-                'is_explicit': False,
-                'confidence': 0.0,
-                'reason': ''
+            return dict(_EMPTY_ROUTING_INFO)
+
+        info = self._routing_info_cache
+        if info is None:
+            routing = self._current_routing
+            info = {
+                'agent_name': routing.agent.name,
+                'command': routing.agent.command,
+                'is_explicit': routing.routing_type == 'command',
+                'confidence': 1.0 if routing.routing_type in ('command', 'mention') else 0.0,
+                'reason': routing.reason
             }
+            self._routing_info_cache = info
 
-        return {
-            'agent_name': self._current_routing.agent.name,
-            'command': self._current_routing.agent.command,
-            'is_explicit': self._current_routing.routing_type == 'command',
-            'confidence': 1.0 if self._current_routing.routing_type in ('command', 'mention') else 0.0,
-            'reason': self._current_routing.reason
-        }
+        return dict(info)
 
     def force_agent(self, agent_name: str) -> bool:
         """Force selection of a specific agent by name."""
         agent = Agent.get(agent_name)
         return agent is not None
 
+    def _is_active_primary(self, agent_name: str) -> bool:
+        """Check if agent_name is already the active primary agent."""
+        current = Agent.default()
+        return (
+            current is not None and
+            current.name == agent_name and
+            Permission.get_current_agent() == agent_name
+        )
+
     def switch_primary_agent(self, agent_name: str) -> bool:
         """Switch to a different primary agent (build/plan)."""
+        if self._is_active_primary(agent_name):
+            return True
         return Agent.switch(agent_name)
 
     def switch_agent(self, agent_name: str) -> bool:
@@ -875,14 +1349,18 @@ class MatlabBridge:
         Returns:
             True if switch was successful
         """
+        if self._is_active_primary(agent_name):
+            return True
+
         success = Agent.switch(agent_name)
 
         if success:
-            self._logger.info("MatlabBridge", "agent_switched", {
-                "agent_name": agent_name
-            })
+            if self._logger.is_enabled_for(LogLevel.INFO):
+                self._log_info("MatlabBridge", "agent_switched", {
+                    "agent_name": agent_name
+                })
         else:
-            self._logger.warn("MatlabBridge", "agent_switch_failed", {
+            self._log_warn("MatlabBridge", "agent_switch_failed", {
                 "agent_name": agent_name
             })
 
@@ -900,10 +1378,11 @@ class MatlabBridge:
         """
         result = Agent.toggle_primary()
 
-        self._logger.info("MatlabBridge", "primary_agent_toggled", {
-            "new_agent": result.get("agent", ""),
-            "description": result.get("description", "")
-        })
+        if self._logger.is_enabled_for(LogLevel.INFO):
+            self._log_info("MatlabBridge", "primary_agent_toggled", {
+                "new_agent": result.get("agent", ""),
+                "description": result.get("description", "")
+            })
 
         return result
 
@@ -918,9 +1397,10 @@ class MatlabBridge:
         """
         Permission.set_auto_execute(enabled)
 
-        self._logger.info("MatlabBridge", "auto_execute_set", {
-            "enabled": enabled
-        })
+        if self._logger.is_enabled_for(LogLevel.INFO):
+            self._log_info("MatlabBridge", "auto_execute_set", {
+                "enabled": enabled
+            })
 
     def set_bypass_mode(self, enabled: bool) -> None:
         """Set the bypass mode global setting.
@@ -933,9 +1413,10 @@ class MatlabBridge:
         """
         Permission.set_bypass_mode(enabled)
 
-        self._logger.info("MatlabBridge", "bypass_mode_set", {
-            "enabled": enabled
-        })
+        if self._logger.is_enabled_for(LogLevel.INFO):
+            self._log_info("MatlabBridge", "bypass_mode_set", {
+                "enabled": enabled
+            })
 
     def get_global_settings(self) -> Dict[str, Any]:
         """Get the current global settings.
@@ -967,40 +1448,31 @@ class MatlabBridge:
         Args:
             mode: Execution mode ('plan', 'prompt', 'auto', 'bypass')
         """
-        import warnings
-        warnings.warn(
-            "set_execution_mode is deprecated. Use agent switching and "
-            "global settings (set_auto_execute, set_bypass_mode) instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
-
-        valid_modes = ('plan', 'prompt', 'auto', 'bypass')
-        if mode not in valid_modes:
-            raise ValueError(f"Invalid execution mode: {mode}")
+        if not MatlabBridge._deprecation_warned:
+            MatlabBridge._deprecation_warned = True
+            warnings.warn(
+                "set_execution_mode is deprecated. Use agent switching and "
+                "global settings (set_auto_execute, set_bypass_mode) instead.",
+                DeprecationWarning,
+                stacklevel=2
+            )
 
         # Map old modes to new architecture
-        if mode == 'plan':
-            Agent.switch('plan')
-            Permission.set_auto_execute(False)
-            Permission.set_bypass_mode(False)
-        elif mode == 'prompt':
-            Agent.switch('build')
-            Permission.set_auto_execute(False)
-            Permission.set_bypass_mode(False)
-        elif mode == 'auto':
-            Agent.switch('build')
-            Permission.set_auto_execute(True)
-            Permission.set_bypass_mode(False)
-        elif mode == 'bypass':
-            Agent.switch('build')
-            Permission.set_auto_execute(True)
-            Permission.set_bypass_mode(True)
-
-        self._logger.info("MatlabBridge", "execution_mode_set_deprecated", {
-            "mode": mode,
-            "primary_agent": Agent.default().name if Agent.default() else ""
-        })
+        try:
+            agent_name, auto_execute, bypass_mode = _EXEC_MODE_TABLE[mode]
+        except KeyError:
+            raise ValueError(f"Invalid execution mode: {mode}") from None
+
+        Agent.switch(agent_name)
+        Permission.set_auto_execute(auto_execute)
+        Permission.set_bypass_mode(bypass_mode)
+
+        if self._logger.is_enabled_for(LogLevel.INFO):
+            agent = Agent.default()
+            self._log_info("MatlabBridge", "execution_mode_set_deprecated", {
+                "mode": mode,
+                "primary_agent": agent.name if agent else ""
+            })
 
     def get_execution_mode(self) -> str:
         """DEPRECATED: Get the current code execution mode.
@@ -1012,11 +1484,11 @@ class MatlabBridge:
             Mode string ('plan', 'prompt', 'auto', 'bypass')
         """
         current_agent = Agent.default()
-        settings = Permission.get_global_settings()
-
         if current_agent and current_agent.name == 'plan':
             return 'plan'
-        elif settings.bypass_mode:
+
+        settings = Permission.get_global_settings()
+        if settings.bypass_mode:
             return 'bypass'
         elif settings.auto_execute:
             return 'auto'
@@ -1048,39 +1520,51 @@ class MatlabBridge:
     def get_tab_state(self, tab_id: str) -> Optional[Dict[str, Any]]:
         """Get state for a single tab."""
         state = self._tab_states.get(tab_id)
-        return state.to_dict() if state else None
+        return state.to_dict() if state is not None else None
 
     def create_tab(self, tab_id: str = "", label: str = "") -> Dict[str, Any]:
         """Create a new tab."""
+        return self._create_tab_state(tab_id, label).to_dict()
+
+    def _create_tab_state(self, tab_id: str = "", label: str = "") -> TabState:
+        """Create a tab (or return the existing one) and return its state."""
         if not tab_id:
-            import uuid
-            tab_id = f"tab_{int(time.time())}_{uuid.uuid4().hex[:5]}"
+            tab_id = f"tab_{int(time.time())}_{secrets.token_hex(3)}"
 
         if not label:
             label = f"Chat {self._next_tab_number}"
             self._next_tab_number += 1
 
-        if tab_id in self._tab_states:
-            return self._tab_states[tab_id].to_dict()
+        tab_state = self._tab_states.get(tab_id)
+        if tab_state is not None:
+            return tab_state
 
-        tab_state = TabState(tab_id=tab_id, label=label)
+        if self._tab_state_pool:
+            tab_state = self._tab_state_pool.pop()
+            tab_state.reset(tab_id, label)
+        else:
+            tab_state = TabState(tab_id=tab_id, label=label)
         self._tab_states[tab_id] = tab_state
 
         if self._active_tab_id is None:
             self._active_tab_id = tab_id
 
-        return tab_state.to_dict()
+        return tab_state
 
     def close_tab(self, tab_id: str) -> bool:
         """Close and remove a tab."""
-        if not tab_id or tab_id not in self._tab_states:
+        state = self._tab_states.pop(tab_id, None) if tab_id else None
+        if state is None:
             return False
 
+        if len(self._tab_state_pool) < _TAB_STATE_POOL_MAX:
+            state.messages.clear()
+            self._tab_state_pool.append(state)
+
         if self._active_tab_id == tab_id:
-            remaining = [tid for tid in self._tab_states.keys() if tid != tab_id]
-            self._active_tab_id = remaining[0] if remaining else None
+            # The closed tab is already popped, so take the first remaining one
+            self._active_tab_id = next(iter(self._tab_states), None)
 
-        del self._tab_states[tab_id]
         return True
 
     def switch_tab(
@@ -1090,18 +1574,21 @@ class MatlabBridge:
         scroll_position: int = 0
     ) -> Optional[Dict[str, Any]]:
         """Switch from one tab to another."""
-        if from_tab_id and from_tab_id in self._tab_states:
-            old_state = self._tab_states[from_tab_id]
+        now = time.time()
+
+        old_state = self._tab_states.get(from_tab_id) if from_tab_id else None
+        if old_state is not None:
             old_state.scroll_position = scroll_position
-            old_state.last_active_at = time.time()
+            old_state.last_active_at = now
 
-        if to_tab_id not in self._tab_states:
-            self.create_tab(to_tab_id)
+        new_state = self._tab_states.get(to_tab_id)
+        if new_state is None:
+            new_state = self._create_tab_state(to_tab_id)
 
         self._active_tab_id = to_tab_id
-        new_state = self._tab_states[to_tab_id]
-        new_state.last_active_at = time.time()
-        new_state.unread_count = 0
+        new_state.last_active_at = now
+        if new_state.unread_count:
+            new_state.unread_count = 0
         if new_state.status == 'unread':
             new_state.status = 'ready'
 
@@ -1115,23 +1602,20 @@ class MatlabBridge:
         images: Optional[List[Dict[str, Any]]] = None
     ) -> bool:
         """Add a message to a tab's history."""
-        if not tab_id or tab_id not in self._tab_states:
+        state = self._tab_states.get(tab_id) if tab_id else None
+        if state is None:
             return False
 
-        state = self._tab_states[tab_id]
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": time.time(),
-        }
-        if images:
-            message["images"] = images
-
-        state.messages.append(message)
+        state.messages.append(Message(
+            role=role,
+            content=content,
+            timestamp=time.time(),
+            images=images or None,
+        ))
 
         if tab_id != self._active_tab_id:
             state.unread_count += 1
-            if state.status not in ('working', 'attention'):
+            if state.status not in _BUSY_STATUSES:
                 state.status = 'unread'
 
         return True
@@ -1143,10 +1627,10 @@ class MatlabBridge:
         current_text: str = ""
     ) -> bool:
         """Update streaming state for a tab."""
-        if not tab_id or tab_id not in self._tab_states:
+        state = self._tab_states.get(tab_id) if tab_id else None
+        if state is None:
             return False
 
-        state = self._tab_states[tab_id]
         state.is_streaming = is_streaming
         state.current_stream_message = current_text
 
@@ -1159,19 +1643,20 @@ class MatlabBridge:
 
     def save_scroll_position(self, tab_id: str, scroll_position: int) -> bool:
         """Save scroll position for a tab."""
-        if not tab_id or tab_id not in self._tab_states:
+        state = self._tab_states.get(tab_id) if tab_id else None
+        if state is None:
             return False
 
-        self._tab_states[tab_id].scroll_position = scroll_position
+        state.scroll_position = scroll_position
         return True
 
     def clear_tab(self, tab_id: str) -> bool:
         """Clear messages for a tab."""
-        if not tab_id or tab_id not in self._tab_states:
+        state = self._tab_states.get(tab_id) if tab_id else None
+        if state is None:
             return False
 
-        state = self._tab_states[tab_id]
-        state.messages = []
+        state.messages.clear()
         state.is_streaming = False
         state.current_stream_message = ""
         state.status = 'ready'
@@ -1182,14 +1667,14 @@ class MatlabBridge:
 
     def update_tab_status(self, tab_id: str, status: str) -> bool:
         """Update status indicator for a tab."""
-        valid_statuses = ('ready', 'working', 'attention', 'unread')
-        if status not in valid_statuses:
+        if status not in _VALID_STATUSES:
             return False
 
-        if not tab_id or tab_id not in self._tab_states:
+        state = self._tab_states.get(tab_id) if tab_id else None
+        if state is None:
             return False
 
-        self._tab_states[tab_id].status = status
+        state.status = status
         return True
 
     # =========================================================================
@@ -1197,30 +1682,58 @@ class MatlabBridge:
     # =========================================================================
 
     def _find_claude_cli(self) -> Optional[str]:
-        """Find Claude CLI executable."""
-        import shutil
-        import glob
+        """Find Claude CLI executable.
+
+        A found path is cached until invalidate_claude_cli_cache() is
+        called (after an install, or when the cached path stops working).
+        A miss is cached for _CLI_PATH_TTL_S seconds so a CLI installed
+        outside the app is still picked up.
+        """
+        if self._claude_cli_path_cache:
+            return self._claude_cli_path_cache
+
+        now = time.monotonic()
+        if (self._claude_cli_path_cached_at and
+                now - self._claude_cli_path_cached_at < self._CLI_PATH_TTL_S):
+            return None
+
+        self._claude_cli_path_cache = self._locate_claude_cli()
+        self._claude_cli_path_cached_at = now
+        return self._claude_cli_path_cache
+
+    def invalidate_claude_cli_cache(self) -> None:
+        """Forget the cached Claude CLI location."""
+        self._claude_cli_path_cache = None
+        self._claude_cli_path_cached_at = 0.0
 
+    def _locate_claude_cli(self) -> Optional[str]:
+        """Search the filesystem for the Claude CLI executable."""
         claude_path = shutil.which('claude')
         if claude_path:
             return claude_path
 
-        native_path = os.path.expanduser('~/.claude/local/bin/claude')
+        native_path = self._claude_native_path
         if os.path.exists(native_path):
             return native_path
 
-        nvm_pattern = os.path.expanduser('~/.nvm/versions/node/*/bin/claude')
-        nvm_matches = glob.glob(nvm_pattern)
-        if nvm_matches:
-            return sorted(nvm_matches)[-1]
-
-        common_paths = [
-            '/usr/local/bin/claude',
-            '/opt/homebrew/bin/claude',
-            os.path.expanduser('~/.npm-global/bin/claude'),
-        ]
-
-        for path in common_paths:
+        # Newest nvm-managed Node first; one directory listing instead of
+        # a glob that stats every version's bin/claude
+        nvm_dir = self._nvm_node_dir
+        try:
+            with os.scandir(nvm_dir) as entries:
+                versions = [e.name for e in entries if not e.name.startswith('.')]
+        except OSError:
+            versions = []
+        # The newest version normally has the CLI, so take max() rather
+        # than sorting; older versions are only tried on a miss
+        while versions:
+            version = max(versions)
+            nvm_path = os.path.join(nvm_dir, version, 'bin', 'claude')
+            if os.path.exists(nvm_path):
+                return nvm_path
+            versions.remove(version)
+
+        for path in self._claude_common_paths:
             if os.path.exists(path):
                 return path
 
@@ -1231,25 +1744,40 @@ class MatlabBridge:
         if method not in ('subscription', 'api_key'):
             raise ValueError(f"Invalid auth method: {method}")
         self._auth_method = method
+        self._invalidate_auth_cache()
 
     def get_auth_method(self) -> str:
         """Get the current authentication method."""
-        return getattr(self, '_auth_method', 'subscription')
+        return self._auth_method
 
     def set_api_key(self, api_key: str) -> None:
-        """Set the API key in the environment."""
-        if api_key:
-            os.environ['ANTHROPIC_API_KEY'] = api_key
-        else:
+        """Set the API key in the environment.
+
+        Strings without the "sk-ant-" prefix (e.g. a partially typed key)
+        are ignored and leave the environment unchanged.
+        """
+        if not api_key:
             self.clear_api_key()
+            return
+
+        if not api_key.startswith('sk-ant-'):
+            return
+
+        if os.environ.get('ANTHROPIC_API_KEY') != api_key:
+            os.environ['ANTHROPIC_API_KEY'] = api_key
+            self._invalidate_auth_cache()
 
     def clear_api_key(self) -> None:
         """Remove the API key from the environment."""
         if 'ANTHROPIC_API_KEY' in os.environ:
             del os.environ['ANTHROPIC_API_KEY']
+        self._invalidate_auth_cache()
 
     def validate_api_key(self, api_key: str) -> Dict[str, Any]:
         """Validate an API key format."""
+        if api_key and _API_KEY_RE.fullmatch(api_key):
+            return {'valid': True, 'message': 'API key format is valid', 'tested': False}
+
         result = {'valid': False, 'message': '', 'tested': False}
 
         if not api_key:
@@ -1268,11 +1796,84 @@ class MatlabBridge:
         result['message'] = 'API key format is valid'
         return result
 
-    def check_cli_auth_status(self) -> Dict[str, Any]:
-        """Check the authentication status of the Claude CLI."""
-        import subprocess
-        from pathlib import Path
+    def _invalidate_auth_cache(self) -> None:
+        """Drop the cached CLI auth status so the next check re-runs it."""
+        self._auth_status_cache = None
+        self._auth_status_cache_ts = 0.0
+
+    def check_cli_auth_status(self, force: bool = False) -> Dict[str, Any]:
+        """Check the authentication status of the Claude CLI.
+
+        Each check spawns `claude auth status` (up to a 10 s timeout), so
+        only the first check, a forced one, or one after an auth change
+        waits for it. Otherwise the cached result is returned immediately,
+        and a result older than _AUTH_STATUS_TTL_S seconds is refreshed in
+        the background for the next call.
+        """
+        return dict(self._cached_cli_auth_status(force))
+
+    def _cached_cli_auth_status(self, force: bool = False) -> Dict[str, Any]:
+        """Return the shared cached auth status dict (callers must not mutate it)."""
+        cached = self._auth_status_cache
+        if cached is not None and not force:
+            if time.monotonic() - self._auth_status_cache_ts >= self._AUTH_STATUS_TTL_S:
+                self._start_auth_refresh()
+            return cached
+
+        result = self._query_cli_auth_status()
+        self._auth_status_cache = result
+        self._auth_status_cache_ts = time.monotonic()
+        return result
+
+    def _submit_background(self, job: Callable[[], None], login: bool = False) -> None:
+        """Queue a job on one of the bridge's worker threads, starting it if needed.
 
+        Args:
+            job: Callable to run
+            login: Run on the login worker instead of the auth refresh worker
+        """
+        jobs = self._login_jobs if login else self._worker_jobs
+        jobs.put(job)
+        with self._state_lock:
+            thread = self._login_thread if login else self._worker_thread
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(
+                    target=_run_background_jobs,
+                    args=(jobs,),
+                    name="derivux-bridge-login" if login else "derivux-bridge-worker",
+                    daemon=True
+                )
+                if login:
+                    self._login_thread = thread
+                else:
+                    self._worker_thread = thread
+                thread.start()
+
+    def _start_auth_refresh(self) -> None:
+        """Refresh the cached CLI auth status on the worker thread."""
+        if self._shutdown_requested:
+            return
+
+        with self._state_lock:
+            if self._auth_refresh_pending:
+                return
+            self._auth_refresh_pending = True
+        self._submit_background(self._refresh_auth_status)
+
+    def _refresh_auth_status(self) -> None:
+        """Re-run the CLI auth status check and update the cache."""
+        try:
+            stale = self._auth_status_cache
+            result = self._query_cli_auth_status()
+            # Drop the result if the cache was invalidated or refilled meanwhile
+            if self._auth_status_cache is stale:
+                self._auth_status_cache = result
+                self._auth_status_cache_ts = time.monotonic()
+        finally:
+            self._auth_refresh_pending = False
+
+    def _query_cli_auth_status(self) -> Dict[str, Any]:
+        """Run `claude auth status` and parse the result."""
         result = {
             'authenticated': False,
             'email': '',
@@ -1302,24 +1903,25 @@ class MatlabBridge:
                 timeout=10
             )
 
-            output = proc.stdout + proc.stderr
-
             if proc.returncode == 0:
                 result['authenticated'] = True
                 result['method'] = 'cli'
                 result['message'] = 'Authenticated via Claude CLI'
 
-                import re
-                for line in output.split('\n'):
-                    email_match = re.search(r'[\w\.-]+@[\w\.-]+', line)
-                    if email_match:
-                        result['email'] = email_match.group(0)
-                        break
+                # Search each stream rather than joining them
+                email_match = (_EMAIL_RE.search(proc.stdout) or
+                               _EMAIL_RE.search(proc.stderr))
+                if email_match:
+                    result['email'] = email_match.group(0)
             else:
                 result['message'] = 'Not logged in. Click "Login with Claude" to authenticate.'
 
         except subprocess.TimeoutExpired:
             result['message'] = 'CLI check timed out.'
+        except FileNotFoundError as e:
+            # Cached CLI path went away; look it up again next time
+            self.invalidate_claude_cli_cache()
+            result['message'] = f'Error: {str(e)[:50]}'
         except Exception as e:
             result['message'] = f'Error: {str(e)[:50]}'
 
@@ -1327,38 +1929,43 @@ class MatlabBridge:
 
     def get_auth_info(self) -> Dict[str, Any]:
         """Get comprehensive authentication information."""
-        info = {
-            'auth_method': self.get_auth_method(),
-            'cli_authenticated': False,
-            'cli_email': '',
-            'has_api_key': False,
-            'api_key_masked': ''
-        }
+        info = self._AUTH_INFO_TEMPLATE.copy()
+        info['auth_method'] = self.get_auth_method()
 
-        cli_status = self.check_cli_auth_status()
+        cli_status = self._cached_cli_auth_status()
         info['cli_authenticated'] = cli_status['authenticated']
         info['cli_email'] = cli_status['email']
 
         api_key = os.environ.get('ANTHROPIC_API_KEY', '')
         if api_key:
             info['has_api_key'] = True
-            if len(api_key) > 20:
-                info['api_key_masked'] = api_key[:13] + '****' + api_key[-4:]
-            else:
-                info['api_key_masked'] = '****'
+            info['api_key_masked'] = self._mask_api_key(api_key)
 
         return info
 
+    def _mask_api_key(self, api_key: str) -> str:
+        """Mask an API key for display, reusing the last result."""
+        cached_key, masked = self._api_key_mask_cache
+        if cached_key == api_key:
+            return masked
+
+        if len(api_key) > 20:
+            masked = api_key[:13] + '****' + api_key[-4:]
+        else:
+            masked = '****'
+        self._api_key_mask_cache = (api_key, masked)
+        return masked
+
     def start_cli_login(self) -> Dict[str, Any]:
         """Start the Claude CLI login process."""
-        import subprocess
-
         result = {
             'started': False,
             'message': '',
             'installing': False
         }
 
+        self._invalidate_auth_cache()
+
         claude_path = self._find_claude_cli()
 
         if not claude_path:
@@ -1375,15 +1982,25 @@ class MatlabBridge:
             result['message'] = 'CLI not found after installation. Restart MATLAB.'
             return result
 
+        with self._state_lock:
+            if self._login_in_progress:
+                result['started'] = True
+                result['message'] = 'Login already in progress. Complete authentication in browser.'
+                return result
+            self._login_in_progress = True
+
         def run_login():
             try:
                 subprocess.run([claude_path, 'auth', 'login'], timeout=120)
             except Exception:
                 pass
+            finally:
+                # Make the next status check see the login result
+                self._invalidate_auth_cache()
+                self._login_in_progress = False
 
         try:
-            thread = threading.Thread(target=run_login, daemon=True)
-            thread.start()
+            self._submit_background(run_login, login=True)
 
             result['started'] = True
             if result['installing']:
@@ -1392,15 +2009,13 @@ class MatlabBridge:
                 result['message'] = 'Login started. Complete authentication in browser.'
 
         except Exception as e:
+            self._login_in_progress = False
             result['message'] = f'Error starting login: {str(e)}'
 
         return result
 
     def _install_claude_cli(self) -> Dict[str, Any]:
         """Install Claude CLI using the native installer."""
-        import subprocess
-        import shutil
-
         result = {'success': False, 'message': ''}
 
         curl_path = shutil.which('curl')
@@ -1409,9 +2024,11 @@ class MatlabBridge:
             return result
 
         try:
+            # Only stderr is reported, so don't buffer the installer's stdout
             proc = subprocess.run(
                 ['bash', '-c', 'curl -fsSL https://claude.ai/install.sh | bash'],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=120
             )
@@ -1419,6 +2036,7 @@ class MatlabBridge:
             if proc.returncode == 0:
                 result['success'] = True
                 result['message'] = 'Claude CLI installed successfully!'
+                self.invalidate_claude_cli_cache()
             else:
                 result['message'] = f'Installation failed: {proc.stderr[:200]}'
 
@@ -17,10 +17,22 @@ import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+
+# Environment variable -> config key overrides applied by ConfigLoader
+_ENV_MAPPINGS: Tuple[Tuple[str, str], ...] = (
+    ("DERIVUX_MODEL", "model"),
+    ("DERIVUX_PRIMARY_AGENT", "primary_agent"),
+    ("DERIVUX_LOG_LEVEL", "log_level"),
+    ("DERIVUX_LOG_DIRECTORY", "log_directory"),
+    ("DERIVUX_AGENTS_DIR", "agents_dir"),
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DerivuxConfig:
     """Parsed Derivux configuration.
 
@@ -78,37 +90,65 @@ class ConfigLoader:
         self.global_config_path = self.home_dir / ".derivux" / "config.json"
         self.project_config_path = self.project_root / ".derivux" / "config.json"
 
+        # Merged file config, keyed by the (mtime, size) stamps of both files
+        self._file_config_cache: Optional[Tuple[Tuple[Any, Any], Dict[str, Any]]] = None
+
     def load(self) -> DerivuxConfig:
         """Load and merge configuration from all sources.
 
+        The config files are only re-read when one of them has changed
+        since the last load; environment variables are applied every time.
+
         Returns:
             Merged DerivuxConfig object
         """
-        config_dict: Dict[str, Any] = {}
+        stamps = (
+            self._file_stamp(self.global_config_path),
+            self._file_stamp(self.project_config_path),
+        )
+        cache = self._file_config_cache
+        if cache is not None and cache[0] == stamps:
+            file_config = cache[1]
+        else:
+            # Both sources are freshly parsed, so merge them in place
+            file_config: Dict[str, Any] = {}
+
+            # 1. Load global config (lowest priority)
+            if stamps[0] is not None:
+                self._merge_into(file_config, self._load_json(self.global_config_path))
 
-        # 1. Load global config (lowest priority)
-        if self.global_config_path.exists():
-            global_config = self._load_json(self.global_config_path)
-            config_dict = self._deep_merge(config_dict, global_config)
+            # 2. Load project config
+            if stamps[1] is not None:
+                self._merge_into(file_config, self._load_json(self.project_config_path))
 
-        # 2. Load project config
-        if self.project_config_path.exists():
-            project_config = self._load_json(self.project_config_path)
-            config_dict = self._deep_merge(config_dict, project_config)
+            self._file_config_cache = (stamps, file_config)
 
-        # 3. Apply environment variables
-        config_dict = self._apply_env_vars(config_dict)
+        # 3. Apply environment variables (to a copy; the cache stays file-only)
+        config_dict = self._apply_env_vars(dict(file_config))
 
         # 4. Create config object with defaults
         return DerivuxConfig(
             model=config_dict.get("model", "claude-sonnet-4-5"),
             primary_agent=config_dict.get("primary_agent", "build"),
-            permissions=config_dict.get("permissions", {}),
+            permissions=dict(config_dict.get("permissions", {})),
             agents_dir=config_dict.get("agents_dir", ".derivux/agents"),
             log_level=config_dict.get("log_level", "INFO"),
             log_directory=config_dict.get("log_directory"),
         )
 
+    def invalidate(self) -> None:
+        """Forget the cached file config so the next load() re-reads it."""
+        self._file_config_cache = None
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _load_json(self, path: Path) -> Dict[str, Any]:
         """Load a JSON configuration file.
 
@@ -119,35 +159,37 @@ class ConfigLoader:
             Parsed JSON as dict, or empty dict on error
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            # Log warning but don't fail
+            # json.loads on bytes skips the text-mode incremental decoder
+            with open(path, 'rb') as f:
+                return json.loads(f.read())
+        except (ValueError, OSError):
+            # Missing, unreadable or malformed; don't fail
             return {}
 
-    def _deep_merge(
+    def _merge_into(
         self,
-        base: Dict[str, Any],
+        target: Dict[str, Any],
         override: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Deep merge two dictionaries.
+    ) -> None:
+        """Deep merge override into target, in place.
 
-        Values from override take precedence. Nested dicts are merged recursively.
+        Values from override take precedence. Nested dicts are merged
+        recursively. Nothing is copied: target (including nested dicts it
+        received from earlier merges) is mutated, so only pass dicts the
+        caller owns, such as freshly parsed JSON.
 
         Args:
-            base: Base dictionary
+            target: Dictionary to update
             override: Override dictionary (takes precedence)
-
-        Returns:
-            Merged dictionary
         """
-        result = base.copy()
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+            # Only dict/dict collisions recurse; JSON objects are always
+            # plain dicts, so an exact type check is enough
+            current = target.get(key)
+            if type(current) is dict and type(value) is dict:
+                self._merge_into(current, value)
             else:
-                result[key] = value
-        return result
+                target[key] = value
 
     def _apply_env_vars(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides.
@@ -163,15 +205,7 @@ class ConfigLoader:
         Returns:
             Updated config dictionary
         """
-        env_mappings = {
-            "DERIVUX_MODEL": "model",
-            "DERIVUX_PRIMARY_AGENT": "primary_agent",
-            "DERIVUX_LOG_LEVEL": "log_level",
-            "DERIVUX_LOG_DIRECTORY": "log_directory",
-            "DERIVUX_AGENTS_DIR": "agents_dir",
-        }
-
-        for env_var, config_key in env_mappings.items():
+        for env_var, config_key in _ENV_MAPPINGS:
             value = os.environ.get(env_var)
             if value is not None:
                 config[config_key] = value
@@ -196,15 +230,23 @@ class ConfigLoader:
     def list_agent_files(self) -> List[Path]:
         """List all agent markdown files.
 
+        Hidden files are skipped, as glob("*.md") would, and so are
+        directories whose names end in .md.
+
         Returns:
             List of paths to agent .md files
         """
         agents_dir = self.get_agents_dir()
-        if not agents_dir.exists():
+        try:
+            with os.scandir(agents_dir) as entries:
+                return [
+                    agents_dir / entry.name for entry in entries
+                    if entry.name.endswith(".md") and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except OSError:
             return []
 
-        return list(agents_dir.glob("*.md"))
-
 
 def load_config(project_root: Optional[str] = None) -> DerivuxConfig:
     """Convenience function to load configuration.
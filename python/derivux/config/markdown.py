@@ -18,11 +18,17 @@ System prompt content goes here...
 ```
 """
 
+import copy
+import functools
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .._compat import DATACLASS_SLOTS
+
 # Try to import yaml, fall back to simple parsing if not available
 try:
     import yaml
@@ -30,8 +36,46 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# Scalar spellings recognized by the fallback YAML parser
+_TRUE_VALUES = frozenset(('true', 'yes', 'on'))
+_FALSE_VALUES = frozenset(('false', 'no', 'off'))
+_NULL_VALUES = frozenset(('null', 'none', '~'))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_scalar(value: str) -> Any:
+    """Parse a YAML scalar string (int, bool, null, or str).
+
+    Cached because frontmatter values such as permission states repeat
+    across agent files; every result is immutable.
+    """
+    # Remove quotes
+    if (value.startswith('"') and value.endswith('"')) or \
+       (value.startswith("'") and value.endswith("'")):
+        return value[1:-1]
+
+    # Try int
+    try:
+        return int(value)
+    except ValueError:
+        pass
+
+    lowered = value.lower()
+
+    # Try bool
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+
+    # Try null
+    if lowered in _NULL_VALUES:
+        return None
+
+    return value
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AgentDefinition:
     """Parsed agent definition from markdown file.
 
@@ -81,6 +125,12 @@ class MarkdownParser:
         re.DOTALL
     )
 
+    # Parsed frontmatter by its YAML text, shared across parser instances.
+    # Agent files are re-parsed whenever agents are reloaded, and YAML
+    # parsing dominates parse_content.
+    _FM_CACHE: Dict[str, Dict[str, Any]] = {}
+    _FM_CACHE_MAX = 128
+
     def parse_file(self, file_path: str) -> AgentDefinition:
         """Parse an agent definition from a markdown file.
 
@@ -125,6 +175,15 @@ class MarkdownParser:
         # Extract frontmatter and body
         frontmatter_dict, body = self._extract_frontmatter(content)
 
+        if not frontmatter_dict:
+            # No metadata: every field but the prompt takes its default
+            return AgentDefinition(
+                name=name,
+                command=f"/{name}",
+                system_prompt=body.strip(),
+                file_path=file_path,
+            )
+
         # Build agent definition
         return AgentDefinition(
             name=name,
@@ -146,7 +205,9 @@ class MarkdownParser:
         Returns:
             Tuple of (frontmatter_dict, body)
         """
-        match = self.FRONTMATTER_PATTERN.match(content)
+        # Cheap prefix check before running the DOTALL regex
+        match = (self.FRONTMATTER_PATTERN.match(content)
+                 if content.startswith('---') else None)
 
         if not match:
             # No frontmatter, treat entire content as body
@@ -155,16 +216,46 @@ class MarkdownParser:
         frontmatter_yaml = match.group(1)
         body = content[match.end():]
 
-        # Parse YAML frontmatter
-        if YAML_AVAILABLE:
-            try:
-                frontmatter_dict = yaml.safe_load(frontmatter_yaml) or {}
-            except yaml.YAMLError:
-                frontmatter_dict = self._simple_yaml_parse(frontmatter_yaml)
-        else:
-            frontmatter_dict = self._simple_yaml_parse(frontmatter_yaml)
+        cache = MarkdownParser._FM_CACHE
+        cached = cache.get(frontmatter_yaml)
+        if cached is None:
+            # Parse YAML frontmatter
+            if YAML_AVAILABLE:
+                try:
+                    cached = yaml.safe_load(frontmatter_yaml) or {}
+                except yaml.YAMLError:
+                    cached = self._simple_yaml_parse(frontmatter_yaml)
+            else:
+                cached = self._simple_yaml_parse(frontmatter_yaml)
+
+            if type(cached) is dict:
+                self._intern_values(cached)
+
+            if len(cache) >= MarkdownParser._FM_CACHE_MAX:
+                # Evict the oldest entry (dicts keep insertion order)
+                cache.pop(next(iter(cache)), None)
+            cache[frontmatter_yaml] = cached
+
+        # Callers own the returned dict (e.g. AgentDefinition.permissions)
+        return copy.deepcopy(cached), body
+
+    @staticmethod
+    def _intern_values(frontmatter: Dict[str, Any]) -> None:
+        """Intern the few-valued strings (permission states, mode, command).
+
+        Agents then share one object per value, and the string compares
+        and hashes done on them downstream hit the identity fast path.
+        """
+        permissions = frontmatter.get("permissions")
+        if type(permissions) is dict:
+            for tool_name, state in permissions.items():
+                if type(state) is str:
+                    permissions[tool_name] = sys.intern(state)
 
-        return frontmatter_dict, body
+        for key in ("mode", "command"):
+            value = frontmatter.get(key)
+            if type(value) is str:
+                frontmatter[key] = sys.intern(value)
 
     def _simple_yaml_parse(self, yaml_content: str) -> Dict[str, Any]:
         """Simple YAML parser for basic key-value pairs.
@@ -190,25 +281,22 @@ class MarkdownParser:
             # Check for nested dict
             if line.startswith('  ') and current_key:
                 # This is a nested value
-                stripped = line.strip()
-                if ':' in stripped:
-                    key, value = stripped.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
+                key, sep, value = line.partition(':')
+                if sep:
                     if nested_dict is None:
                         nested_dict = {}
                         result[current_key] = nested_dict
-                    nested_dict[key] = self._parse_value(value)
+                    nested_dict[key.strip()] = _parse_scalar(value.strip())
                 continue
 
             # Top-level key-value
-            if ':' in line:
-                current_key, value = line.split(':', 1)
-                current_key = current_key.strip()
+            key, sep, value = line.partition(':')
+            if sep:
+                current_key = key.strip()
                 value = value.strip()
 
                 if value:
-                    result[current_key] = self._parse_value(value)
+                    result[current_key] = _parse_scalar(value)
                     nested_dict = None
                 else:
                     # Empty value, might be followed by nested dict
@@ -225,28 +313,7 @@ class MarkdownParser:
         Returns:
             Parsed value (int, bool, or str)
         """
-        # Remove quotes
-        if (value.startswith('"') and value.endswith('"')) or \
-           (value.startswith("'") and value.endswith("'")):
-            return value[1:-1]
-
-        # Try int
-        try:
-            return int(value)
-        except ValueError:
-            pass
-
-        # Try bool
-        if value.lower() in ('true', 'yes', 'on'):
-            return True
-        if value.lower() in ('false', 'no', 'off'):
-            return False
-
-        # Try null
-        if value.lower() in ('null', 'none', '~'):
-            return None
-
-        return value
+        return _parse_scalar(value)
 
 
 def load_agent_from_file(file_path: str) -> AgentDefinition:
@@ -265,23 +332,35 @@ def load_agent_from_file(file_path: str) -> AgentDefinition:
 def load_all_agents(agents_dir: str) -> List[AgentDefinition]:
     """Load all agent definitions from a directory.
 
+    Hidden files are skipped, as glob("*.md") would, and so are
+    directories whose names end in .md.
+
     Args:
         agents_dir: Path to agents directory
 
     Returns:
         List of parsed AgentDefinition objects
     """
-    agents_path = Path(agents_dir)
-    if not agents_path.exists():
+    # One directory scan (no per-entry stat) and one read per file;
+    # parse_file's exists() check would only repeat what scandir saw
+    try:
+        with os.scandir(agents_dir) as entries:
+            md_files = [
+                entry.path for entry in entries
+                if entry.name.endswith(".md") and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except OSError:
         return []
 
     parser = MarkdownParser()
     agents = []
 
-    for md_file in agents_path.glob("*.md"):
+    for md_path in md_files:
         try:
-            agent = parser.parse_file(str(md_file))
-            agents.append(agent)
+            with open(md_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            agents.append(parser.parse_content(content, Path(md_path).stem, md_path))
         except Exception:
             # Skip invalid files
             continue
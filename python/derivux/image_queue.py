@@ -40,8 +40,12 @@ class ImageQueue:
         Returns:
             List of image dicts
         """
+        # Lock-free fast path for the common idle poll
+        if not self._images:
+            return []
+
         with self._queue_lock:
-            images = self._images.copy()
+            images = self._images
             self._images = []
             return images
 
@@ -230,6 +230,13 @@ class StructuredLogger:
 
             self._close_file()
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check if a message at the given level would be written.
+
+        Lets callers skip building log payloads that would be dropped.
+        """
+        return self._enabled and level >= self._level
+
     # Level-specific logging methods
     def error(
         self,
@@ -21,6 +21,9 @@ from typing import Any, Dict, Optional
 
 from derivux.logger import configure_logger, get_logger
 
+# Environment variable spellings treated as true
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
 
 def configure_from_matlab_settings(settings: Dict[str, Any]) -> None:
     """Configure logger from MATLAB Settings object converted to dict.
@@ -75,7 +78,7 @@ def _parse_bool(value: Optional[str], default: bool) -> bool:
     """Parse string to boolean."""
     if value is None:
         return default
-    return value.lower() in ("1", "true", "yes", "on")
+    return value.lower() in _TRUE_VALUES
 
 
 def get_session_id() -> str:
@@ -5,11 +5,14 @@ These tools use the @tool decorator from claude-agent-sdk to create
 in-process MCP tools that Claude can use autonomously.
 """
 
+import atexit
 import base64
+import itertools
+import shutil
 import tempfile
 import os
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from claude_agent_sdk import tool
 from .matlab_engine import get_engine
@@ -21,6 +24,35 @@ _logger = get_logger()
 # Global headless mode setting (controlled by bridge.py)
 _headless_mode: bool = True
 
+# Private directory for figure capture files, created on first capture
+# (and again if it disappears)
+_capture_dir: Optional[str] = None
+_capture_ids = itertools.count()
+
+# Prefix of the lines _capture_figures prints for figures it failed to save
+_CAPTURE_ERROR_TAG = "__claude_capture_error__"
+
+# Read size for base64-encoding captured images; a multiple of 3 so each
+# block encodes without padding
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+# Invariant MATLAB snippets, kept as constants so every call sends the same
+# text. State needed after user code runs (previous figure visibility, open
+# figures) is printed back and kept in Python: user code that runs `clear`
+# would wipe it from the MATLAB workspace.
+_SAVE_AND_HIDE_CMD = (
+    "disp(char(get(0, 'DefaultFigureVisible'))); "
+    "set(0, 'DefaultFigureVisible', 'off');"
+)
+_LIST_FIGS_CMD = "disp(num2str(double(findall(0, 'Type', 'figure'))'));"
+_RESTORE_VISIBLE_CMDS = {
+    "on": "set(0, 'DefaultFigureVisible', 'on');",
+    "off": "set(0, 'DefaultFigureVisible', 'off');",
+}
+_CLEAR_NEW_FIGS_CMD = "clear claude_new_figs__;"
+_HIDE_ALL_FIGS_CMD = "set(findall(0, 'Type', 'figure'), 'Visible', 'off');"
+_HIDE_CURRENT_FIG_CMD = "set(gcf, 'Visible', 'off');"
+
 
 def set_headless_mode(enabled: bool) -> None:
     """Set the global headless mode for figure suppression.
@@ -38,76 +70,189 @@ def get_headless_mode() -> bool:
     return _headless_mode
 
 
-def _get_figure_handles(engine) -> set:
-    """Get set of current figure handles."""
+def _prepare_figures(engine, hide: bool, snapshot: bool) -> Tuple[str, List[int]]:
+    """Turn figure display off and/or list the open figures in one eval.
+
+    Args:
+        engine: MATLAB engine instance
+        hide: Set DefaultFigureVisible off
+        snapshot: List the handles of the figures open now
+
+    Returns:
+        (previous DefaultFigureVisible value, or '' if not hidden;
+        handles of the open figures, or [] if not listed)
+    """
+    commands = []
+    if hide:
+        commands.append(_SAVE_AND_HIDE_CMD)
+    if snapshot:
+        commands.append(_LIST_FIGS_CMD)
+    if not commands:
+        return "", []
+
+    lines = engine.eval(" ".join(commands), capture_output=True).splitlines()
+
+    prev_visible = ""
+    if hide:
+        prev_visible = "off" if lines and lines[0].strip() == "off" else "on"
+        lines = lines[1:]
+
+    handles: List[int] = []
+    # An empty figure list prints nothing, so a missing or non-numeric
+    # line means no figures were open
+    if snapshot and lines:
+        try:
+            handles = [int(float(h)) for h in lines[0].split()]
+        except ValueError:
+            handles = []
+    return prev_visible, handles
+
+
+def _new_figure_handles(engine, existing: List[int], hide: bool = False) -> List[int]:
+    """Get handles of figures opened since existing was listed.
+
+    The difference is computed in MATLAB and read back as one workspace
+    variable, optionally hiding all figures in the same eval.
+    """
+    existing_list = " ".join(str(h) for h in existing)
+    cmd = (
+        f"claude_new_figs__ = setdiff(double(findall(0, 'Type', 'figure')), [{existing_list}]);"
+    )
+    if hide:
+        cmd += f" if ~isempty(claude_new_figs__), {_HIDE_ALL_FIGS_CMD} end"
     try:
-        # Get all figure handles as a MATLAB array
-        handles_str = engine.eval("num2str(findall(0, 'Type', 'figure')')", capture_output=True)
-        if handles_str and handles_str.strip():
-            return set(int(float(h)) for h in handles_str.split() if h.strip())
+        engine.eval(cmd, capture_output=False)
+        handles = engine.get_variable("claude_new_figs__")
     except Exception:
+        return []
+    # A single handle comes back as a float, several as a matlab.double
+    # vector that iterates as rows
+    if isinstance(handles, (int, float)):
+        return [int(handles)]
+    return sorted(int(h) for row in handles for h in row)
+
+
+def _capture_path(fmt: str) -> str:
+    """Return a fresh path for MATLAB to write a figure capture to.
+
+    Captures share one private directory, so no placeholder temp file has
+    to be created and closed before MATLAB writes each image. A fresh
+    directory is made if a temp cleaner removed the previous one.
+    """
+    global _capture_dir
+    if _capture_dir is None or not os.path.isdir(_capture_dir):
+        _capture_dir = tempfile.mkdtemp(prefix="derivux_figs_")
+        atexit.register(shutil.rmtree, _capture_dir, True)
+    return os.path.join(_capture_dir, f"fig_{next(_capture_ids)}.{fmt}")
+
+
+def _remove_capture(path: str) -> None:
+    """Delete a capture file, ignoring one MATLAB never wrote."""
+    try:
+        os.remove(path)
+    except OSError:
         pass
-    return set()
 
 
-def _capture_figure(engine, fig_handle: int, fmt: str = "png", close_after: bool = True) -> Dict[str, Any]:
-    """Capture a figure as base64-encoded image.
+def _read_base64(path: str) -> Tuple[str, int]:
+    """Read a file and base64-encode it block by block.
+
+    The raw file is never held in full, so peak memory is the encoded
+    bytes plus the final str rather than raw + encoded + str.
+
+    Returns:
+        Tuple of (base64 text, file size in bytes)
+    """
+    encoded = bytearray()
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_B64_CHUNK_SIZE)
+            if not block:
+                break
+            size += len(block)
+            encoded += base64.b64encode(block)
+    return encoded.decode("ascii"), size
+
+
+def _capture_figures(engine, fig_handles: List[int], fmt: str = "png") -> List[Dict[str, Any]]:
+    """Capture figures as base64-encoded images in one MATLAB round trip.
+
+    Every figure is hidden (in headless mode), printed to a capture file
+    and closed by a single engine.eval; failures are reported back on
+    MATLAB's output and turned into text blocks.
 
     Args:
         engine: MATLAB engine instance
-        fig_handle: Handle of the figure to capture
+        fig_handles: Handles of the figures to capture, in output order
         fmt: Image format ('png' or 'svg')
-        close_after: Whether to close the figure after capturing
 
     Returns:
-        Dict with image content block
+        List with one image block (or failure text block) per figure
     """
-    with tempfile.NamedTemporaryFile(suffix=f".{fmt}", delete=False) as tmp:
-        tmp_path = tmp.name
+    if not fig_handles:
+        return []
 
-    try:
+    paths = [_capture_path(fmt) for _ in fig_handles]
+    hide = get_headless_mode()
+
+    statements = []
+    for fig_handle, tmp_path in zip(fig_handles, paths):
         # Ensure figure stays invisible during capture (defense in depth)
         # This handles edge cases where headless mode might not be fully applied
-        if get_headless_mode():
-            engine.eval(f"set({fig_handle}, 'Visible', 'off');", capture_output=False)
-
-        # Use print command for better quality output
+        hide_cmd = f"set({fig_handle}, 'Visible', 'off'); " if hide else ""
         if fmt == "png":
             # Use print with higher resolution for better quality
-            engine.eval(
-                f"print({fig_handle}, '-dpng', '-r150', '{tmp_path}')",
-                capture_output=False
-            )
+            save_cmd = f"print({fig_handle}, '-dpng', '-r150', '{tmp_path}');"
         else:
-            engine.eval(f"saveas({fig_handle}, '{tmp_path}')", capture_output=False)
-
+            save_cmd = f"saveas({fig_handle}, '{tmp_path}');"
         # Close the figure to avoid cluttering the desktop
-        if close_after:
-            engine.eval(f"close({fig_handle});", capture_output=False)
+        statements.append(
+            f"try, {hide_cmd}{save_cmd} close({fig_handle}); "
+            f"catch claude_err__, fprintf('{_CAPTURE_ERROR_TAG} %d %s\\n', "
+            f"{fig_handle}, claude_err__.message); end;"
+        )
+    statements.append("clear claude_err__;")
+
+    content: List[Dict[str, Any]] = []
+    try:
+        output = engine.eval(" ".join(statements), capture_output=True)
 
-        # Read and encode the image
-        with open(tmp_path, "rb") as f:
-            image_data = f.read()
+        errors: Dict[int, str] = {}
+        for line in output.splitlines():
+            if line.startswith(_CAPTURE_ERROR_TAG):
+                handle, _, message = line[len(_CAPTURE_ERROR_TAG):].strip().partition(" ")
+                errors[int(handle)] = message
 
-        base64_image = base64.b64encode(image_data).decode("utf-8")
         media_type = "image/png" if fmt == "png" else "image/svg+xml"
+        for fig_handle, tmp_path in zip(fig_handles, paths):
+            if fig_handle in errors:
+                content.append({"type": "text", "text": f"Failed to capture figure {fig_handle}: {errors[fig_handle]}"})
+                continue
 
-        image_block = {
-            "type": "image",
-            "source": {
-                "type": "base64",
-                "media_type": media_type,
-                "data": base64_image
+            try:
+                base64_image, _ = _read_base64(tmp_path)
+            except OSError as e:
+                content.append({"type": "text", "text": f"Failed to capture figure {fig_handle}: {e}"})
+                continue
+
+            image_block = {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": media_type,
+                    "data": base64_image
+                }
             }
-        }
 
-        # Push to the image queue for direct delivery to UI
-        push_image(image_block)
+            # Push to the image queue for direct delivery to UI
+            push_image(image_block)
+            content.append(image_block)
 
-        return image_block
+        return content
     finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        for tmp_path in paths:
+            _remove_capture(tmp_path)
 
 
 def _format_matrix_output(engine, output: str) -> str:
@@ -204,13 +349,11 @@ async def matlab_execute(args: Dict[str, Any]) -> Dict[str, Any]:
         if not engine.is_connected:
             engine.connect()
 
-        # Get existing figure handles before execution
-        existing_figs = _get_figure_handles(engine) if capture_figures else set()
-
-        # Apply headless mode - suppress figure windows during execution
-        if _headless_mode:
-            engine.eval("__claude_prev_visible = get(0, 'DefaultFigureVisible');", capture_output=False)
-            engine.eval("set(0, 'DefaultFigureVisible', 'off');", capture_output=False)
+        # Get existing figure handles and apply headless mode (suppress
+        # figure windows during execution) in one round trip
+        prev_visible, existing_figs = _prepare_figures(
+            engine, hide=_headless_mode, snapshot=capture_figures
+        )
 
         try:
             # Execute the code
@@ -228,25 +371,25 @@ async def matlab_execute(args: Dict[str, Any]) -> Dict[str, Any]:
             # This prevents figures from flashing visible during capture
             figures_captured = 0
             if capture_figures:
-                new_figs = _get_figure_handles(engine) - existing_figs
-
-                # Force all new figures invisible before capture (handles user code
-                # that explicitly set Visible='on')
-                if _headless_mode and new_figs:
-                    engine.eval("set(findall(0, 'Type', 'figure'), 'Visible', 'off');", capture_output=False)
-
-                for fig_handle in sorted(new_figs):
-                    try:
-                        image_block = _capture_figure(engine, fig_handle, close_after=True)
-                        content.append(image_block)
-                        figures_captured += 1
-                    except Exception as e:
-                        content.append({"type": "text", "text": f"Failed to capture figure {fig_handle}: {e}"})
+                # Force all figures invisible before capture when there are new
+                # ones (handles user code that explicitly set Visible='on')
+                new_figs = _new_figure_handles(engine, existing_figs, hide=bool(prev_visible))
+
+                try:
+                    figure_blocks = _capture_figures(engine, new_figs)
+                except Exception as e:
+                    figure_blocks = [
+                        {"type": "text", "text": f"Failed to capture figure {fig_handle}: {e}"}
+                        for fig_handle in new_figs
+                    ]
+                content.extend(figure_blocks)
+                figures_captured = sum(1 for block in figure_blocks if block["type"] == "image")
         finally:
             # Restore figure visibility setting AFTER capture is complete
-            if _headless_mode:
-                engine.eval("set(0, 'DefaultFigureVisible', __claude_prev_visible);", capture_output=False)
-                engine.eval("clear __claude_prev_visible;", capture_output=False)
+            if prev_visible:
+                engine.eval(_RESTORE_VISIBLE_CMDS[prev_visible], capture_output=False)
+            if capture_figures:
+                engine.eval(_CLEAR_NEW_FIGS_CMD, capture_output=False)
 
         duration_ms = (time.perf_counter() - start_time) * 1000
         _logger.info_timed("matlab_tools", "execute_complete", {
@@ -370,9 +513,7 @@ async def matlab_plot(args: Dict[str, Any]) -> Dict[str, Any]:
             engine.connect()
 
         # Apply headless mode - suppress figure windows during plotting
-        if _headless_mode:
-            engine.eval("__claude_prev_visible = get(0, 'DefaultFigureVisible');", capture_output=False)
-            engine.eval("set(0, 'DefaultFigureVisible', 'off');", capture_output=False)
+        prev_visible, _ = _prepare_figures(engine, hide=_headless_mode, snapshot=False)
 
         try:
             # Create a new figure to ensure clean state
@@ -381,18 +522,17 @@ async def matlab_plot(args: Dict[str, Any]) -> Dict[str, Any]:
             # Defense in depth: explicitly set the new figure invisible
             # (handles edge cases where DefaultFigureVisible might not fully apply)
             if _headless_mode:
-                engine.eval("set(gcf, 'Visible', 'off');", capture_output=False)
+                engine.eval(_HIDE_CURRENT_FIG_CMD, capture_output=False)
 
             # Execute the plotting code
             engine.eval(code, capture_output=False)
 
             # Hide any figures that user code may have made visible before capture
             if _headless_mode:
-                engine.eval("set(gcf, 'Visible', 'off');", capture_output=False)
+                engine.eval(_HIDE_CURRENT_FIG_CMD, capture_output=False)
 
             # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=f".{fmt}", delete=False) as tmp:
-                tmp_path = tmp.name
+            tmp_path = _capture_path(fmt)
 
             try:
                 # Use print for higher quality output
@@ -403,10 +543,7 @@ async def matlab_plot(args: Dict[str, Any]) -> Dict[str, Any]:
                 engine.eval("close(gcf);", capture_output=False)
 
                 # Read and encode the image
-                with open(tmp_path, "rb") as f:
-                    image_data = f.read()
-
-                base64_image = base64.b64encode(image_data).decode("utf-8")
+                base64_image, image_size = _read_base64(tmp_path)
                 media_type = "image/png" if fmt == "png" else "image/svg+xml"
 
                 image_block = {
@@ -424,7 +561,7 @@ async def matlab_plot(args: Dict[str, Any]) -> Dict[str, Any]:
                 duration_ms = (time.perf_counter() - start_time) * 1000
                 _logger.info_timed("matlab_tools", "figure_captured", {
                     "format": fmt,
-                    "image_size_bytes": len(image_data)
+                    "image_size_bytes": image_size
                 }, duration_ms)
 
                 return {
@@ -436,14 +573,12 @@ async def matlab_plot(args: Dict[str, Any]) -> Dict[str, Any]:
 
             finally:
                 # Clean up temp file
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
+                _remove_capture(tmp_path)
 
         finally:
             # Restore figure visibility setting
-            if _headless_mode:
-                engine.eval("set(0, 'DefaultFigureVisible', __claude_prev_visible);", capture_output=False)
-                engine.eval("clear __claude_prev_visible;", capture_output=False)
+            if prev_visible:
+                engine.eval(_RESTORE_VISIBLE_CMDS[prev_visible], capture_output=False)
 
     except Exception as e:
         _logger.error("matlab_tools", "plot_error", {
@@ -245,6 +245,14 @@ class _PermissionRegistry:
         """
         self._current_agent = agent_name
 
+    def get_current_agent(self) -> str:
+        """Get the current agent used for permission checks.
+
+        Returns:
+            Name of the current agent ("" if none set)
+        """
+        return self._current_agent
+
     def check(
         self,
         tool_name: str,
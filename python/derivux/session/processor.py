@@ -107,6 +107,8 @@ class SessionProcessor:
         self._mcp_server = None
         self._session_id: Optional[str] = None
         self._turn_count = 0
+        self._stop_requested = False
+        self._last_query_interrupted = False
 
         # Ensure tools are registered
         register_builtin_tools()
@@ -120,6 +122,9 @@ class SessionProcessor:
         Raises:
             RuntimeError: If SDK not available or CLI not found
         """
+        # Cleared first so a failed start never leaves a stale stop request
+        self._stop_requested = False
+
         if not SDK_AVAILABLE:
             raise RuntimeError("Claude Agent SDK not available")
 
@@ -163,9 +168,17 @@ class SessionProcessor:
         self._client = ClaudeSDKClient(options=options)
         await self._client.__aenter__()
 
+    def request_stop(self) -> None:
+        """Ask an in-flight query to stop at its next message.
+
+        Safe to call from any thread; does not wait for the query to end.
+        """
+        self._stop_requested = True
+
     async def stop(self) -> None:
         """Stop the current session."""
         if self._client:
+            self._stop_requested = True
             self._logger.info("SessionProcessor", "stopping", {
                 "agent": self._current_agent.name if self._current_agent else "",
                 "turns": self._turn_count,
@@ -201,13 +214,21 @@ class SessionProcessor:
             - {"type": "text", "text": "..."}
             - {"type": "image", "source": {...}}
             - {"type": "tool_use", "name": "..."}
+
+        If a stop is requested mid-stream the response is cut short and
+        last_query_interrupted is set.
         """
         if not self._client:
             raise RuntimeError("Session not started. Call start() first.")
 
+        self._last_query_interrupted = False
         await self._client.query(prompt)
 
         async for message in self._client.receive_response():
+            if self._stop_requested:
+                self._last_query_interrupted = True
+                break
+
             msg_type = type(message).__name__
 
             if msg_type == 'AssistantMessage':
@@ -251,13 +272,15 @@ class SessionProcessor:
             prompt: User's message
 
         Returns:
-            Dict with 'text', 'images', 'tool_uses', 'session_id'
+            Dict with 'text', 'images', 'tool_uses', 'session_id' and
+            'interrupted' (True if a stop cut the response short)
         """
         result = {
             'text': '',
             'images': [],
             'tool_uses': [],
             'session_id': self._session_id,
+            'interrupted': False,
         }
 
         async for content in self.query(prompt):
@@ -269,6 +292,7 @@ class SessionProcessor:
                 result['tool_uses'].append(content.get('name', ''))
 
         result['session_id'] = self._session_id
+        result['interrupted'] = self._last_query_interrupted
         return result
 
     def _create_mcp_server(self):
@@ -324,6 +348,11 @@ class SessionProcessor:
         """Get the conversation turn count."""
         return self._turn_count
 
+    @property
+    def last_query_interrupted(self) -> bool:
+        """Check if a stop request cut the last query's response short."""
+        return self._last_query_interrupted
+
     @property
     def is_running(self) -> bool:
         """Check if a session is currently running."""
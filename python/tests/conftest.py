@@ -0,0 +1,7 @@
+"""Shared pytest setup for the derivux Python tests."""
+
+import os
+import sys
+
+# Make the in-tree derivux package importable without installing it
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,166 @@
+"""Tests for MatlabBridge's event loop and processor coordination."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("claude_agent_sdk")
+
+from derivux import bridge as bridge_module
+from derivux.bridge import _ASYNC_BUFFER_MAXLEN, MatlabBridge
+
+
+class FakeProcessor:
+    """Stands in for SessionProcessor and records the calls it receives."""
+
+    def __init__(self, stop_delay: float = 0.0, stream=()):
+        self.stop_delay = stop_delay
+        self.stream = list(stream)
+        self.events = []
+        self.is_running = True
+        self.current_agent = None
+        self.session_id = ""
+
+    async def start(self, agent):
+        self.events.append("start")
+        self.is_running = True
+        self.current_agent = agent
+
+    async def stop(self):
+        self.events.append("stop_begin")
+        await asyncio.sleep(self.stop_delay)
+        self.is_running = False
+        self.events.append("stop_end")
+
+    async def query(self, prompt):
+        self.events.append("query")
+        for content in self.stream:
+            yield content
+
+    async def query_full(self, prompt):
+        self.events.append("query")
+        return {"text": prompt, "session_id": "", "tool_uses": []}
+
+
+def _wait_for(condition, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def bridge():
+    bridge = MatlabBridge(use_agent_sdk=True)
+    yield bridge
+    bridge.shutdown(timeout=1.0)
+
+
+def test_send_after_interrupt_waits_for_processor_stop(bridge):
+    processor = FakeProcessor(stop_delay=0.2)
+    bridge._processor = processor
+    bridge._processor_running = True
+    # Pretend an async message is in flight so interrupt_process has work to do
+    bridge._async_complete = False
+
+    assert bridge.interrupt_process()
+    result = bridge.send_message("hello")
+
+    assert result["success"], result["error"]
+    assert processor.events.index("stop_end") < processor.events.index("query")
+    assert bridge._pending_stop is None
+
+
+def test_overlapping_runs_without_loop_all_complete(bridge):
+    bridge._loop.call_soon_threadsafe(bridge._loop.stop)
+    bridge._loop_thread.join(timeout=2.0)
+    assert not bridge._loop.is_running()
+
+    async def work(value):
+        await asyncio.sleep(0.1)
+        return value
+
+    results = {}
+    errors = []
+
+    def run(value):
+        try:
+            results[value] = bridge._run_without_loop(work(value))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(value,)) for value in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5.0)
+
+    assert errors == []
+    assert results == {1: 1, 2: 2, 3: 3}
+
+
+def test_shutdown_from_loop_thread_stops_processor(bridge):
+    processor = FakeProcessor(stop_delay=0.1)
+    bridge._processor = processor
+    bridge._processor_running = True
+
+    results = []
+    bridge._loop.call_soon_threadsafe(lambda: results.append(bridge.shutdown(timeout=1.0)))
+    bridge._loop_thread.join(timeout=2.0)
+
+    assert results == [False]
+    assert not bridge._loop_thread.is_alive()
+    assert processor.events == ["stop_begin", "stop_end"]
+    assert not bridge._processor_running
+
+
+def test_poll_logs_items_dropped_by_buffer_overflow(bridge):
+    warnings = []
+    bridge._log_warn = lambda *args: warnings.append(args)
+    stream = [{"type": "text", "text": str(index)} for index in range(_ASYNC_BUFFER_MAXLEN + 5)]
+    processor = FakeProcessor(stream=stream)
+    bridge._processor = processor
+    bridge._processor_running = True
+
+    bridge.start_async_message("hello")
+    _wait_for(bridge.is_async_complete)
+
+    chunks = bridge.poll_async_chunks()
+    assert len(chunks) == _ASYNC_BUFFER_MAXLEN
+    assert chunks[0] == "5"
+    assert len(bridge.poll_async_content()) == _ASYNC_BUFFER_MAXLEN
+    assert [(data["buffer"], data["dropped"]) for _, event, data in warnings] == [
+        ("chunks", 5), ("content", 5)
+    ]
+
+    # Counts already logged are not reported again
+    bridge._async_chunks.append("more")
+    assert bridge.poll_async_chunks() == ["more"]
+    assert len(warnings) == 2
+
+
+def test_cli_login_reuses_worker_and_rejects_second_login(bridge, monkeypatch):
+    release = threading.Event()
+    logins = []
+
+    def fake_run(args, **kwargs):
+        logins.append(args)
+        release.wait(timeout=5.0)
+
+    monkeypatch.setattr(MatlabBridge, "_find_claude_cli", lambda self: "/usr/bin/claude")
+    monkeypatch.setattr(bridge_module.subprocess, "run", fake_run)
+
+    first = bridge.start_cli_login()
+    second = bridge.start_cli_login()
+    assert first["started"] and second["started"]
+    assert "already in progress" in second["message"]
+
+    worker = bridge._login_thread
+    release.set()
+    _wait_for(lambda: not bridge._login_in_progress)
+
+    bridge.start_cli_login()
+    assert bridge._login_thread is worker
+    _wait_for(lambda: len(logins) == 2)
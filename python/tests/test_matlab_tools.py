@@ -0,0 +1,125 @@
+"""Tests for the MATLAB commands and capture files used by matlab_tools."""
+
+import asyncio
+import os
+import re
+import shutil
+
+import pytest
+
+pytest.importorskip("claude_agent_sdk")
+
+from derivux import matlab_tools
+
+
+class FakeEngine:
+    """Records eval'd code and serves workspace variables from a dict.
+
+    An eval whose code starts with a key of outputs prints that value.
+    """
+
+    is_connected = True
+
+    def __init__(self, variables=None, outputs=None):
+        self.commands = []
+        self.variables = variables or {}
+        self.outputs = outputs or {}
+
+    def eval(self, code, capture_output=True):
+        self.commands.append(code)
+        for prefix, output in self.outputs.items():
+            if code.startswith(prefix):
+                return output
+        return ""
+
+    def get_variable(self, name):
+        return self.variables[name]
+
+
+def _identifiers(command):
+    """MATLAB identifiers in command, ignoring the contents of char literals."""
+    return re.findall(r"[A-Za-z_]\w*", re.sub(r"'[^']*'", "''", command))
+
+
+def _assert_valid_identifiers(command):
+    # MATLAB identifiers must start with a letter
+    bad = [name for name in _identifiers(command) if not name[0].isalpha()]
+    assert bad == [], command
+
+
+def test_capture_figures_command_uses_valid_identifiers():
+    engine = FakeEngine()
+
+    blocks = matlab_tools._capture_figures(engine, [1, 2])
+
+    assert len(engine.commands) == 1
+    command = engine.commands[0]
+    _assert_valid_identifiers(command)
+    assert command.count("try, ") == 2
+    assert command.count("end;") == 2
+    assert command.endswith("clear claude_err__;")
+    # Nothing was written by the fake engine, so both captures fail cleanly
+    assert [block["type"] for block in blocks] == ["text", "text"]
+
+
+def test_matlab_execute_commands_use_valid_identifiers(monkeypatch):
+    engine = FakeEngine({"claude_new_figs__": []})
+    monkeypatch.setattr(matlab_tools, "get_engine", lambda: engine)
+    handler = getattr(matlab_tools.matlab_execute, "handler", matlab_tools.matlab_execute)
+
+    asyncio.run(handler({"code": "x = 1;"}))
+
+    assert "x = 1;" in engine.commands
+    for command in engine.commands:
+        if command != "x = 1;":
+            _assert_valid_identifiers(command)
+
+
+def test_new_figure_handles_reads_matlab_setdiff():
+    engine = FakeEngine({"claude_new_figs__": 4.0})
+    assert matlab_tools._new_figure_handles(engine, [1, 2]) == [4]
+    assert "setdiff(double(findall(0, 'Type', 'figure')), [1 2])" in engine.commands[0]
+
+    assert matlab_tools._new_figure_handles(
+        FakeEngine({"claude_new_figs__": [[3.0], [1.0]]}), []
+    ) == [1, 3]
+    assert matlab_tools._new_figure_handles(FakeEngine({"claude_new_figs__": []}), []) == []
+
+
+def test_prepare_figures_parses_visibility_and_handles():
+    engine = FakeEngine(outputs={"disp(char(": "off\n1  4\n"})
+    assert matlab_tools._prepare_figures(engine, hide=True, snapshot=True) == ("off", [1, 4])
+
+    engine = FakeEngine(outputs={"disp(char(": "on\n"})
+    assert matlab_tools._prepare_figures(engine, hide=True, snapshot=True) == ("on", [])
+
+    engine = FakeEngine(outputs={"disp(num2str(": "7\n"})
+    assert matlab_tools._prepare_figures(engine, hide=False, snapshot=True) == ("", [7])
+
+
+def test_matlab_execute_survives_user_clear(monkeypatch):
+    # Nothing matlab_execute needs after the user code may live in the
+    # MATLAB workspace, since the code can start with `clear all`
+    engine = FakeEngine({"claude_new_figs__": []}, outputs={"disp(char(": "off\n1\n"})
+    monkeypatch.setattr(matlab_tools, "get_engine", lambda: engine)
+    monkeypatch.setattr(matlab_tools, "_headless_mode", True)
+    handler = getattr(matlab_tools.matlab_execute, "handler", matlab_tools.matlab_execute)
+
+    asyncio.run(handler({"code": "clear all; figure;"}))
+
+    after = engine.commands[engine.commands.index("clear all; figure;") + 1:]
+    assert "setdiff(double(findall(0, 'Type', 'figure')), [1])" in after[0]
+    assert "set(0, 'DefaultFigureVisible', 'off');" in after
+    assert "clear claude_new_figs__;" in after
+    assert not any("claude_prev" in command for command in engine.commands)
+
+
+def test_capture_path_recreates_removed_directory():
+    first = matlab_tools._capture_path("png")
+    capture_dir = os.path.dirname(first)
+    shutil.rmtree(capture_dir)
+
+    second = matlab_tools._capture_path("png")
+
+    assert os.path.isdir(os.path.dirname(second))
+    assert os.path.dirname(second) != capture_dir
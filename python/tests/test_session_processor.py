@@ -0,0 +1,81 @@
+"""Tests for SessionProcessor's stop handling."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("claude_agent_sdk")
+
+from derivux.session import processor as processor_module
+from derivux.session.processor import SessionProcessor
+
+
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class AssistantMessage:
+    def __init__(self, text):
+        self.content = [TextBlock(text)]
+
+
+class FakeClient:
+    """Streams one AssistantMessage per text, requesting a stop before stop_at."""
+
+    def __init__(self, processor, texts, stop_at=None):
+        self.processor = processor
+        self.texts = texts
+        self.stop_at = stop_at
+
+    async def query(self, prompt):
+        pass
+
+    async def receive_response(self):
+        for index, text in enumerate(self.texts):
+            if index == self.stop_at:
+                self.processor.request_stop()
+            yield AssistantMessage(text)
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+def test_query_full_marks_stopped_response_interrupted():
+    processor = SessionProcessor()
+    processor._client = FakeClient(processor, ["one ", "two ", "three"], stop_at=1)
+
+    result = asyncio.run(processor.query_full("hello"))
+
+    assert result["text"] == "one "
+    assert result["interrupted"]
+    assert processor.last_query_interrupted
+
+
+def test_query_full_complete_response_not_interrupted():
+    processor = SessionProcessor()
+    processor._client = FakeClient(processor, ["one ", "two"])
+
+    result = asyncio.run(processor.query_full("hello"))
+
+    assert result["text"] == "one two"
+    assert not result["interrupted"]
+
+
+def test_stop_without_client_leaves_stop_flag_clear():
+    processor = SessionProcessor()
+
+    asyncio.run(processor.stop())
+
+    assert not processor._stop_requested
+
+
+def test_failed_start_clears_stop_flag(monkeypatch):
+    processor = SessionProcessor()
+    processor.request_stop()
+    monkeypatch.setattr(processor_module, "SDK_AVAILABLE", False)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(processor.start(None))
+
+    assert not processor._stop_requested
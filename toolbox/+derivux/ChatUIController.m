@@ -1071,10 +1071,11 @@ classdef ChatUIController < handle
                 statusData.hasApiKey = authInfo.hasApiKey;
                 statusData.apiKeyMasked = authInfo.apiKeyMasked;
 
-                % Get CLI auth status from Python
+                % Get CLI auth status from Python; forced past its cache,
+                % since this runs when the user asks for the status
                 if ~isempty(obj.PythonBridge)
                     try
-                        cliStatus = obj.PythonBridge.check_cli_auth_status();
+                        cliStatus = obj.PythonBridge.check_cli_auth_status(pyargs('force', true));
                         cliStatus = obj.pyDictToStruct(cliStatus);
                         statusData.cliAuthenticated = logical(cliStatus.authenticated);
                         statusData.cliEmail = char(cliStatus.email);